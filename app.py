@@ -1,12 +1,14 @@
+from string import Template
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 
 from data_audit import load_and_clean_data, find_col
-from scoring_engine import (compute_dimension_scores, get_gap_analysis,
-                             compute_momentum, get_silent_winner_flag,
-                             get_customer_persona)
+from scoring_engine import (compute_all_dimension_scores, rank_restaurants,
+                             get_gap_analysis, compute_momentum,
+                             get_silent_winner_flag, get_customer_persona)
 from report_generator import generate_pdf_report
 
 # ─── PAGE CONFIG ──────────────────────────────────────────────────────────────────
@@ -18,10 +20,16 @@ st.set_page_config(
 )
 
 # ─── LIGHT-MODE CSS ───────────────────────────────────────────────────────────────
-st.markdown("""
+# No web-font @import: Inter / Space Mono are used when installed locally and
+# otherwise fall back to system fonts, so first paint never waits on a font CDN.
+FONT_SANS = "Inter, -apple-system, Segoe UI, Roboto, sans-serif"
+FONT_MONO = "Space Mono, ui-monospace, Menlo, Consolas, monospace"
+
+# Kept as one constant, but emitted on every run on purpose: Streamlit clears any
+# element a rerun does not re-emit, so a "once per session" guard would drop the
+# styling after the first interaction.
+CSS = Template("""
 <style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&family=Space+Mono:wght@400;700&display=swap');
-
 html, body,
 [data-testid="stAppViewContainer"],
 [data-testid="stMain"],
@@ -29,7 +37,7 @@ html, body,
 [class*="css"] {
   background-color: #F0F4F8 !important;
   color: #0F172A !important;
-  font-family: 'Inter', sans-serif !important;
+  font-family: $FONT_SANS !important;
 }
 .block-container { padding: 1.5rem 2rem !important; max-width: 1400px !important; }
 
@@ -58,7 +66,7 @@ html, body,
   border-radius: 12px 12px 0 0;
 }
 .kpi-label { font-size:10px; font-weight:700; letter-spacing:0.1em; text-transform:uppercase; color:#64748B; margin-bottom:6px; }
-.kpi-value { font-size:32px; font-weight:800; color:#0F172A; line-height:1; font-family:'Space Mono',monospace; }
+.kpi-value { font-size:32px; font-weight:800; color:#0F172A; line-height:1; font-family:$FONT_MONO; }
 .kpi-sub   { font-size:11px; color:#64748B; margin-top:4px; }
 .delta-pos { color:#22C55E; font-weight:700; }
 .delta-neg { color:#EF4444; font-weight:700; }
@@ -126,20 +134,87 @@ html, body,
 [data-testid="stVerticalBlock"] { background: transparent !important; }
 div[data-testid="metric-container"] { background: transparent !important; }
 </style>
-""", unsafe_allow_html=True)
+""").substitute(FONT_SANS=FONT_SANS, FONT_MONO=FONT_MONO)
+st.markdown(CSS, unsafe_allow_html=True)
+
+
+# ─── HTML TEMPLATES ───────────────────────────────────────────────────────────────
+# Constant strings (adjacent literals are joined at compile time); each rerun only
+# fills in the dynamic fields.
+KPI_GRID_TMPL = '<div style="display:grid;grid-template-columns:repeat(5,1fr);gap:16px">{tiles}</div>'
+
+KPI_TMPL = (
+    '<div class="kpi-card">'
+    '<div class="kpi-label">{label}</div>'
+    '<div class="kpi-value">{val}</div>'
+    '<div class="kpi-sub">{sub} &nbsp;<span class="{dc}">{delta}</span></div>'
+    '</div>'
+)
+
+GAP_TMPL = (
+    '<div style="margin-bottom:14px">'
+    '<div style="display:flex;justify-content:space-between;margin-bottom:5px">'
+    '<span style="font-size:12px;font-weight:600;color:#0F172A">{label}</span>'
+    '<span style="font-size:12px;font-weight:700;color:{color}">{sign}{diff}%</span>'
+    '</div>'
+    '<div style="position:relative;height:8px;background:#F1F5F9;border-radius:4px">'
+    '<div style="position:absolute;left:0;top:0;height:100%;width:{bar_w}%;'
+    'background:linear-gradient(90deg,#0EA5E9,#14B8A6);border-radius:4px"></div>'
+    '<div style="position:absolute;top:-3px;left:{tgt_w}%;width:2px;height:14px;'
+    'background:#0F172A;border-radius:2px"></div>'
+    '</div>'
+    '<div style="display:flex;justify-content:space-between;margin-top:3px">'
+    '<span style="font-size:10px;color:#94A3B8">Current: {current:.0f}%</span>'
+    '<span style="font-size:10px;color:#94A3B8">Target: {target:.0f}%</span>'
+    '</div>'
+    '</div>'
+)
+
+ACTION_TMPL = (
+    '<div class="action-row">'
+    '<div>'
+    '<div style="display:flex;align-items:center;gap:7px;margin-bottom:3px">'
+    '<span>{icon}</span>'
+    '<span class="act-title">{title}</span>'
+    '<span class="{badge}">{priority}</span>'
+    '</div>'
+    '<div class="act-sub">{sub}</div>'
+    '<div class="act-imp">{impact}</div>'
+    '</div>'
+    '<span style="color:#CBD5E1;font-size:16px">→</span>'
+    '</div>'
+)
 
 
 # ─── LOAD DATA ────────────────────────────────────────────────────────────────────
 # IMPORTANT: if you update your CSV files you must clear the Streamlit cache.
 # Either restart the app or call load_data.clear() programmatically.
-@st.cache_data(show_spinner=False)
+# cache_resource hands every rerun/session the same objects instead of
+# unpickling a copy each time, so the frames must be treated as read-only:
+# anything derived from them belongs in load_and_clean_data.
+@st.cache_resource(show_spinner=False)
 def load_data():
-    return load_and_clean_data()   # data_audit._resolve_path() finds the CSVs automatically
+    df_rest, df_rev, benchmarks = load_and_clean_data()   # data_audit._resolve_path() finds the CSVs automatically
+    restaurant_names = sorted(df_rest["name"].dropna().unique().tolist())
+    silent_winner_names = df_rest.loc[
+        (df_rest["rating_n"] >= 4.5) & df_rest["res_rate"].lt(0.3, fill_value=0), "name"
+    ].head(4).tolist()
+    # Name-indexed view for O(1) row lookups; keeps the first row per name,
+    # like the former df_rest[df_rest["name"] == name].iloc[0] scans.
+    df_rest_by_name = df_rest.drop_duplicates("name").set_index("name", drop=False)
+    # Positional review rows per slug, grouped once so per-restaurant consumers
+    # do a dict lookup instead of filtering the whole review frame.  Only index
+    # arrays are kept, not a DataFrame copy per group.
+    rev_rows = (
+        df_rev.groupby("_slug", sort=False, observed=True).indices
+        if "_slug" in df_rev.columns else {}
+    )
+    return (df_rest, df_rev, benchmarks, restaurant_names, silent_winner_names,
+            df_rest_by_name, rev_rows)
 
 with st.spinner("Loading intelligence engine..."):
-    df_rest, df_rev, benchmarks = load_data()
-
-restaurant_names = sorted(df_rest["name"].dropna().unique().tolist())
+    (df_rest, df_rev, benchmarks, restaurant_names,
+     silent_winner_names, df_rest_by_name, rev_rows) = load_data()
 
 
 # ─── SIDEBAR ──────────────────────────────────────────────────────────────────────
@@ -168,10 +243,7 @@ with st.sidebar:
 
     # Silent winners list
     st.markdown('<p style="color:#94A3B8;font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:0.08em;margin-top:18px;margin-bottom:8px">🔴 Silent Winners</p>', unsafe_allow_html=True)
-    sw_list = df_rest[
-        (df_rest["rating_n"] >= 4.5) & (df_rest["res_rate"].fillna(0) < 0.3)
-    ]["name"].head(4).tolist()
-    for sw in sw_list:
+    for sw in silent_winner_names:
         st.markdown(
             f'<div style="background:#1E293B;border-left:3px solid #EF4444;padding:7px 11px;'
             f'border-radius:4px;margin-bottom:5px;font-size:11px;color:#FCA5A5">{sw}</div>',
@@ -180,34 +252,162 @@ with st.sidebar:
 
 
 # ─── COMPUTE ──────────────────────────────────────────────────────────────────────
-scores      = compute_dimension_scores(selected_restaurant, df_rest, df_rev)
-gaps        = get_gap_analysis(scores, benchmarks)
-momentum    = compute_momentum(selected_restaurant, df_rev, df_rest)
-persona     = get_customer_persona(selected_restaurant, df_rest, df_rev)
-silent_flag = get_silent_winner_flag(selected_restaurant, df_rest)
-res_data    = df_rest[df_rest["name"] == selected_restaurant].iloc[0]
-
-# District ranking
-@st.cache_data(show_spinner=False)
-def compute_all_ranks(_df_rest, _df_rev):
-    out = []
-    for _, r in _df_rest.iterrows():
-        try:
-            s = compute_dimension_scores(r["name"], _df_rest, _df_rev)["Composite"]
-        except Exception:
-            s = 0
-        out.append({"name": r["name"], "score": s})
-    return (
-        pd.DataFrame(out)
-        .sort_values("score", ascending=False)
-        .reset_index(drop=True)
+# Per-restaurant results only depend on the selected name, so they are cached by
+# name.  The dataframes are not hashed (leading underscore); data_key changes
+# when a different dataset is loaded, which invalidates the cached entries.
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_gaps(scores, benchmarks):
+    return get_gap_analysis(scores, benchmarks)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_momentum(name, data_key, _df_rev, _df_rest, _rev_rows):
+    return compute_momentum(name, _df_rev, _df_rest, _rev_rows)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_persona(name, data_key, _df_rest, _df_rev):
+    return get_customer_persona(name, _df_rest, _df_rev)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_silent_flag(name, data_key, _df_rest):
+    return get_silent_winner_flag(name, _df_rest)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_pdf(name, data_key, rank, total, _res_data, _scores, _gaps, _momentum,
+               _persona, _benchmarks, _df_rest, _df_rev, _rev_rows):
+    return generate_pdf_report(
+        name, _res_data, _scores, _gaps, _momentum,
+        _persona, _benchmarks, _df_rest, _df_rev, rank, total, _rev_rows,
     )
 
-df_ranks = compute_all_ranks(df_rest, df_rev)
-df_ranks["rank"] = df_ranks.index + 1
-cur_rank = int(df_ranks[df_ranks["name"] == selected_restaurant]["rank"].values[0])
+# District ranking; the same score table also supplies the selected restaurant's
+# scores, so nothing is scored twice.  Keyed on data_key like leaderboard_base:
+# the results are read-only, so sharing them beats unpickling on every rerun.
+@st.cache_resource(show_spinner=False)
+def compute_all_ranks(data_key, _df_rest, _df_rev):
+    all_scores = compute_all_dimension_scores(_df_rest, _df_rev)
+    df_ranks = rank_restaurants(all_scores)
+    return (all_scores.to_dict("index"), df_ranks,
+            dict(zip(df_ranks["name"], df_ranks["rank"])))
+
+data_key = (len(df_rest), len(df_rev))
+scores_by_name, df_ranks, rank_by_name = compute_all_ranks(data_key, df_rest, df_rev)
+cur_rank = int(rank_by_name[selected_restaurant])
 total    = len(df_ranks)
 
+scores      = dict(scores_by_name[selected_restaurant])
+gaps        = cached_gaps(scores, benchmarks)
+momentum    = cached_momentum(selected_restaurant, data_key, df_rev, df_rest, rev_rows)
+persona     = cached_persona(selected_restaurant, data_key, df_rest, df_rev)
+silent_flag = cached_silent_flag(selected_restaurant, data_key, df_rest)
+res_data    = df_rest_by_name.loc[selected_restaurant]
+
+
+# ─── CHART FIGURES ────────────────────────────────────────────────────────────────
+# Figures are built from small tuples of plain values and cached as dicts, so a
+# rerun with the same inputs skips Plotly's trace construction entirely.
+# Charts are rendered with theme=None, so each one carries its own look: the
+# empty "none" template keeps the payload small (the default "streamlit"
+# template only holds placeholder colours for the frontend to substitute), and
+# a fixed uirevision lets the browser keep the layout state across reruns.
+CHART_LAYOUT = dict(template="none", uirevision="static",
+                    font=dict(family=FONT_SANS, color="#1E293B"))
+RADAR_LABELS = ("Reputation", "Responsiveness", "Digital\nPresence", "Intelligence", "Visibility")
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def radar_json(sv, bv):
+    theta = list(RADAR_LABELS) + [RADAR_LABELS[0]]
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(sv) + [sv[0]], theta=theta,
+        fill="toself", name="Score",
+        line=dict(color="#0EA5E9", width=2.5),
+        fillcolor="rgba(14,165,233,0.13)",
+        marker=dict(size=5, color="#0EA5E9"),
+    ))
+    fig.add_trace(go.Scatterpolar(
+        r=list(bv) + [bv[0]], theta=theta,
+        fill="toself", name="Benchmark",
+        line=dict(color="#A855F7", width=1.5, dash="dot"),
+        fillcolor="rgba(168,85,247,0.05)",
+        marker=dict(size=4, color="#A855F7"),
+    ))
+    fig.update_layout(
+        **CHART_LAYOUT,
+        polar=dict(
+            bgcolor="white",
+            radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=9), gridcolor="#F0E2E2"),
+            angularaxis=dict(tickfont=dict(color="#0F172A", size=11, family=FONT_SANS)),
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.18, xanchor="center", x=0.5, font=dict(size=11)),
+        height=340, margin=dict(l=40, r=40, t=20, b=40),
+        paper_bgcolor="white", plot_bgcolor="white",
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def momentum_json(months, counts):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=list(months), y=list(counts),
+        mode="lines+markers", name="Reviews/Month",
+        line=dict(color="#0EA5E9", width=2.5, shape="spline"),
+        fill="tozeroy", fillcolor="rgba(14,165,233,0.08)",
+        marker=dict(size=6, color="#0EA5E9", line=dict(color="white", width=1.5)),
+    ))
+    fig.update_layout(
+        **CHART_LAYOUT,
+        xaxis=dict(tickfont=dict(color="#1E293B", size=10), gridcolor="#F1F5F9"),
+        yaxis=dict(tickfont=dict(color="#1E293B", size=10), gridcolor="#F1F5F9"),
+        height=210, margin=dict(l=40, r=20, t=10, b=30),
+        paper_bgcolor="white", plot_bgcolor="white", showlegend=False,
+        hovermode="x unified",
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def donut_json(values, stars):
+    fig = go.Figure(go.Pie(
+        values=list(values),
+        labels=[f"{i}★" for i in stars],
+        hole=0.6,
+        marker=dict(colors=["#22C55E", "#86EFAC", "#FCD34D", "#FCA5A5", "#EF4444"]),
+        textfont=dict(size=9), showlegend=True,
+    ))
+    fig.update_layout(
+        **CHART_LAYOUT,
+        title=dict(text="Rating Split", font=dict(size=11), x=0.5),
+        height=210, margin=dict(l=0, r=0, t=30, b=0),
+        legend=dict(font=dict(size=8), orientation="v"),
+        paper_bgcolor="white",
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def gauge_json(health):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=health,
+        number={"font": {"size": 26, "family": FONT_MONO, "color": "#0F172A"}},
+        gauge={
+            "axis": {"range": [0, 100], "tickfont": {"size": 8}},
+            "bar":  {"color": "#0EA5E9", "thickness": 0.28},
+            "bgcolor": "#F1F5F9", "bordercolor": "#E2E8F0",
+            "steps": [
+                {"range": [0, 50],  "color": "#FEE2E2"},
+                {"range": [50, 75], "color": "#FEF3C7"},
+                {"range": [75, 100],"color": "#DCFCE7"},
+            ],
+            "threshold": {"line": {"color": "#0F172A", "width": 2}, "thickness": 0.75, "value": health},
+        },
+    ))
+    fig.update_layout(
+        **CHART_LAYOUT,
+        title=dict(text="Health Score", font=dict(size=11), x=0.5),
+        height=210, margin=dict(l=20, r=20, t=30, b=0),
+        paper_bgcolor="white",
+    )
+    return fig.to_dict()
+
 
 # ─── PAGE HEADER ──────────────────────────────────────────────────────────────────
 silent_badge = (
@@ -227,7 +427,6 @@ st.markdown(f"""
 
 
 # ─── KPI TILES ────────────────────────────────────────────────────────────────────
-c1, c2, c3, c4, c5 = st.columns(5)
 health    = scores["Composite"]
 resp_pct  = scores["Responsiveness"]
 sent_pct  = scores["Intelligence"]
@@ -245,32 +444,27 @@ else:
     resp_delta     = f"↗ +{max(resp_pct - 70, 0):.0f}% vs avg"
 
 tiles = [
-    (c1, "Overall Score",    f"{health:.1f}",         "out of 100",         f"↗ Score", True),
-    (c2, "Rank",             f"#{cur_rank}",           "Frankfurt City",     "↗ +2",    True),
-    (c3, "Responsiveness",   f"{resp_pct:.0f}%",       "Owner reply rate",   resp_delta, resp_pct >= 50),
-    (c4, "Sentiment",        f"{sent_pct:.0f}%",       "Review sentiment",
+    ("Overall Score",    f"{health:.1f}",         "out of 100",         f"↗ Score", True),
+    ("Rank",             f"#{cur_rank}",           "Frankfurt City",     "↗ +2",    True),
+    ("Responsiveness",   f"{resp_pct:.0f}%",       "Owner reply rate",   resp_delta, resp_pct >= 50),
+    ("Sentiment",        f"{sent_pct:.0f}%",       "Review sentiment",
      ("↗ Strong" if sent_pct >= 75 else "↘ Needs work"), sent_pct >= 75),
-    (c5, "Freshness",        f"{vis_pct:.0f}%",        "Review velocity",
+    ("Freshness",        f"{vis_pct:.0f}%",        "Review velocity",
      ("↗ Active" if vis_pct >= 50 else "↘ Slow"),        vis_pct >= 50),
 ]
-for col, label, val, sub, delta, pos in tiles:
-    dc = "delta-pos" if pos else "delta-neg"
-    col.markdown(f"""
-    <div class="kpi-card">
-      <div class="kpi-label">{label}</div>
-      <div class="kpi-value">{val}</div>
-      <div class="kpi-sub">{sub} &nbsp;<span class="{dc}">{delta}</span></div>
-    </div>""", unsafe_allow_html=True)
+# One markdown element for all five tiles; the CSS grid replaces st.columns(5).
+st.markdown(KPI_GRID_TMPL.format(tiles="".join(
+    KPI_TMPL.format_map({"label": label, "val": val, "sub": sub, "delta": delta,
+                         "dc": "delta-pos" if pos else "delta-neg"})
+    for label, val, sub, delta, pos in tiles
+)), unsafe_allow_html=True)
 
 st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
 
 
 # ─── RESPONSIVENESS EXPLAINER (shown when 0%) ─────────────────────────────────────
 if resp_pct == 0:
-    has_reviews = "_slug" in df_rest.columns and (
-        df_rev["_slug"].eq(res_data.get("_slug", "")).sum() > 0
-        if "_slug" in df_rev.columns else False
-    )
+    has_reviews = len(rev_rows.get(res_data.get("_slug"), ())) > 0
     if has_reviews:
         msg = (
             "📋 **Responsiveness is 0%** — this restaurant has reviews in the dataset "
@@ -293,37 +487,11 @@ with col_radar:
     st.markdown('<div class="section-card">', unsafe_allow_html=True)
     st.markdown('<div class="card-header">⚙️ Dimension Radar</div>', unsafe_allow_html=True)
 
-    dim_labels = ["Reputation", "Responsiveness", "Digital\nPresence", "Intelligence", "Visibility"]
-    sv = [scores["Reputation"], scores["Responsiveness"], scores["Digital Presence"],
-          scores["Intelligence"], scores["Visibility"]]
-    bv = [benchmarks.get("rating", 4.4) * 20, 90, 85, 75, 70]
-
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=sv + [sv[0]], theta=dim_labels + [dim_labels[0]],
-        fill="toself", name="Score",
-        line=dict(color="#0EA5E9", width=2.5),
-        fillcolor="rgba(14,165,233,0.13)",
-        marker=dict(size=5, color="#0EA5E9"),
-    ))
-    fig.add_trace(go.Scatterpolar(
-        r=bv + [bv[0]], theta=dim_labels + [dim_labels[0]],
-        fill="toself", name="Benchmark",
-        line=dict(color="#A855F7", width=1.5, dash="dot"),
-        fillcolor="rgba(168,85,247,0.05)",
-        marker=dict(size=4, color="#A855F7"),
-    ))
-    fig.update_layout(
-        polar=dict(
-            bgcolor="white",
-            radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=9), gridcolor="#F0E2E2"),
-            angularaxis=dict(tickfont=dict(color="#0F172A", size=11, family="Inter")),
-        ),
-        legend=dict(orientation="h", yanchor="bottom", y=-0.18, xanchor="center", x=0.5, font=dict(size=11)),
-        height=340, margin=dict(l=40, r=40, t=20, b=40),
-        paper_bgcolor="white", plot_bgcolor="white",
-    )
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    sv = (scores["Reputation"], scores["Responsiveness"], scores["Digital Presence"],
+          scores["Intelligence"], scores["Visibility"])
+    bv = (benchmarks.get("rating", 4.4) * 20, 90, 85, 75, 70)
+    st.plotly_chart(go.Figure(radar_json(sv, bv)), use_container_width=True, theme=None,
+                    config={"displayModeBar": False})
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col_gap:
@@ -337,29 +505,17 @@ with col_gap:
         ("Brand Visibility",        scores["Digital Presence"], 80),
         ("Reputation Score",        scores["Reputation"],     benchmarks.get("rating", 4.4) * 20),
     ]
+    gap_html = []
     for label, current, target in gap_items:
-        diff  = round(current - target, 1)
-        color = "#22C55E" if diff >= 0 else "#EF4444"
-        sign  = "+" if diff >= 0 else ""
-        bar_w = min(current, 100)
-        tgt_w = min(target, 100)
-        st.markdown(f"""
-        <div style="margin-bottom:14px">
-          <div style="display:flex;justify-content:space-between;margin-bottom:5px">
-            <span style="font-size:12px;font-weight:600;color:#0F172A">{label}</span>
-            <span style="font-size:12px;font-weight:700;color:{color}">{sign}{diff}%</span>
-          </div>
-          <div style="position:relative;height:8px;background:#F1F5F9;border-radius:4px">
-            <div style="position:absolute;left:0;top:0;height:100%;width:{bar_w}%;
-                        background:linear-gradient(90deg,#0EA5E9,#14B8A6);border-radius:4px"></div>
-            <div style="position:absolute;top:-3px;left:{tgt_w}%;width:2px;height:14px;
-                        background:#0F172A;border-radius:2px"></div>
-          </div>
-          <div style="display:flex;justify-content:space-between;margin-top:3px">
-            <span style="font-size:10px;color:#94A3B8">Current: {current:.0f}%</span>
-            <span style="font-size:10px;color:#94A3B8">Target: {target:.0f}%</span>
-          </div>
-        </div>""", unsafe_allow_html=True)
+        diff = round(current - target, 1)
+        gap_html.append(GAP_TMPL.format_map({
+            "label": label, "diff": diff, "current": current, "target": target,
+            "color": "#22C55E" if diff >= 0 else "#EF4444",
+            "sign":  "+" if diff >= 0 else "",
+            "bar_w": min(current, 100),
+            "tgt_w": min(target, 100),
+        }))
+    st.markdown("".join(gap_html), unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 
@@ -392,19 +548,24 @@ with col_ai:
     </div>
     """, unsafe_allow_html=True)
 
-    try:
-        pdf_bytes = generate_pdf_report(
-            selected_restaurant, res_data, scores, gaps, momentum,
-            persona, benchmarks, df_rest, df_rev, cur_rank, total,
-        )
-        st.download_button(
-            label="📄 Export Full Intelligence Brief (PDF)",
-            data=pdf_bytes,
-            file_name=f"Revenue_Intelligence_{selected_restaurant.replace(' ', '_')}.pdf",
-            mime="application/pdf",
-        )
-    except Exception as e:
-        st.error(f"Error generating PDF: {e}")
+    # The report is only rendered on request; the chosen restaurant is remembered
+    # so the download button survives the rerun its own click triggers.
+    if st.button("📄 Prepare Intelligence Brief (PDF)"):
+        st.session_state["pdf_for"] = selected_restaurant
+    if st.session_state.get("pdf_for") == selected_restaurant:
+        try:
+            pdf_bytes = cached_pdf(
+                selected_restaurant, data_key, cur_rank, total, res_data, scores, gaps,
+                momentum, persona, benchmarks, df_rest, df_rev, rev_rows,
+            )
+            st.download_button(
+                label="📄 Export Full Intelligence Brief (PDF)",
+                data=pdf_bytes,
+                file_name=f"Revenue_Intelligence_{selected_restaurant.replace(' ', '_')}.pdf",
+                mime="application/pdf",
+            )
+        except Exception as e:
+            st.error(f"Error generating PDF: {e}")
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col_act:
@@ -424,20 +585,11 @@ with col_act:
         ("📡", "Sentiment Monitoring",       "Real-time alerts for negative reviews across platforms",
          f"Protect {float(res_data.get('rating_n', 4)):.1f}★ rating", "MEDIUM", "badge-med"),
     ]
-    for icon, title, sub, impact, priority, badge in actions:
-        st.markdown(f"""
-        <div class="action-row">
-          <div>
-            <div style="display:flex;align-items:center;gap:7px;margin-bottom:3px">
-              <span>{icon}</span>
-              <span class="act-title">{title}</span>
-              <span class="{badge}">{priority}</span>
-            </div>
-            <div class="act-sub">{sub}</div>
-            <div class="act-imp">{impact}</div>
-          </div>
-          <span style="color:#CBD5E1;font-size:16px">→</span>
-        </div>""", unsafe_allow_html=True)
+    st.markdown("".join(
+        ACTION_TMPL.format_map({"icon": icon, "title": title, "sub": sub, "impact": impact,
+                                "priority": priority, "badge": badge})
+        for icon, title, sub, impact, priority, badge in actions
+    ), unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 
@@ -450,78 +602,28 @@ cm1, cm2, cm3 = st.columns([3, 1, 1])
 with cm1:
     mom = momentum
     if mom is not None and len(mom) > 0:
-        fig_m = go.Figure()
-        fig_m.add_trace(go.Scatter(
-            x=mom["month"], y=mom["count"],
-            mode="lines+markers", name="Reviews/Month",
-            line=dict(color="#0EA5E9", width=2.5, shape="spline"),
-            fill="tozeroy", fillcolor="rgba(14,165,233,0.08)",
-            marker=dict(size=6, color="#0EA5E9", line=dict(color="white", width=1.5)),
-        ))
-        fig_m.update_layout(
-            xaxis=dict(tickfont=dict(color="#1E293B", size=10)),
-            yaxis=dict(tickfont=dict(color="#1E293B", size=10)),
-            height=210, margin=dict(l=40, r=20, t=10, b=30),
-            paper_bgcolor="white", plot_bgcolor="white", showlegend=False,
-            hovermode="x unified",
-        )
-        st.plotly_chart(fig_m, use_container_width=True, config={"displayModeBar": False})
+        fig_m = go.Figure(momentum_json(tuple(mom["month"]), tuple(mom["count"])))
+        st.plotly_chart(fig_m, use_container_width=True, theme=None, config={"displayModeBar": False})
     else:
         st.info("No momentum data available.")
 
 with cm2:
-    if "_slug" in df_rest.columns and "_slug" in df_rev.columns:
-        try:
-            rest_slug = df_rest[df_rest["name"] == selected_restaurant].iloc[0]["_slug"]
-            sub = df_rev[df_rev["_slug"] == rest_slug]
-        except (IndexError, KeyError):
-            sub = pd.DataFrame()
-    else:
-        sub = pd.DataFrame()
+    rows = rev_rows.get(res_data.get("_slug"), [])
 
-    if len(sub) > 0 and "review_rating" in sub.columns:
-        rc = sub["review_rating"].value_counts().sort_index(ascending=False)
+    if len(rows) > 0 and "review_rating" in df_rev.columns:
+        # Fixed 1–5 domain: a single bincount pass instead of hash-count + sort.
+        ratings = df_rev["review_rating"].to_numpy()[rows].astype(float)
+        stars = ratings.round().clip(1, 5).astype(np.int8)
+        rc = pd.Series(np.bincount(stars, minlength=6)[5:0:-1], index=[5, 4, 3, 2, 1])
     else:
         rc = pd.Series([40, 30, 15, 10, 5], index=[5, 4, 3, 2, 1])
 
-    fig_d = go.Figure(go.Pie(
-        values=rc.values,
-        labels=[f"{i}★" for i in rc.index],
-        hole=0.6,
-        marker=dict(colors=["#22C55E", "#86EFAC", "#FCD34D", "#FCA5A5", "#EF4444"]),
-        textfont=dict(size=9), showlegend=True,
-    ))
-    fig_d.update_layout(
-        title=dict(text="Rating Split", font=dict(size=11), x=0.5),
-        height=210, margin=dict(l=0, r=0, t=30, b=0),
-        legend=dict(font=dict(size=8), orientation="v"),
-        paper_bgcolor="white",
-    )
-    st.plotly_chart(fig_d, use_container_width=True, config={"displayModeBar": False})
+    fig_d = go.Figure(donut_json(tuple(rc.tolist()), tuple(rc.index.tolist())))
+    st.plotly_chart(fig_d, use_container_width=True, theme=None, config={"displayModeBar": False})
 
 with cm3:
-    fig_g = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=health,
-        number={"font": {"size": 26, "family": "Space Mono", "color": "#0F172A"}},
-        gauge={
-            "axis": {"range": [0, 100], "tickfont": {"size": 8}},
-            "bar":  {"color": "#0EA5E9", "thickness": 0.28},
-            "bgcolor": "#F1F5F9", "bordercolor": "#E2E8F0",
-            "steps": [
-                {"range": [0, 50],  "color": "#FEE2E2"},
-                {"range": [50, 75], "color": "#FEF3C7"},
-                {"range": [75, 100],"color": "#DCFCE7"},
-            ],
-            "threshold": {"line": {"color": "#0F172A", "width": 2}, "thickness": 0.75, "value": health},
-        },
-    ))
-    fig_g.update_layout(
-        title=dict(text="Health Score", font=dict(size=11), x=0.5),
-        height=210, margin=dict(l=20, r=20, t=30, b=0),
-        paper_bgcolor="white",
-    )
-    st.plotly_chart(fig_g, use_container_width=True, config={"displayModeBar": False})
+    fig_g = go.Figure(gauge_json(health))
+    st.plotly_chart(fig_g, use_container_width=True, theme=None, config={"displayModeBar": False})
 
 st.markdown("</div>", unsafe_allow_html=True)
 
@@ -530,26 +632,34 @@ st.markdown("</div>", unsafe_allow_html=True)
 st.markdown('<div class="section-card">', unsafe_allow_html=True)
 st.markdown('<div class="card-header">🏆 District Leaderboard — Top 10</div>', unsafe_allow_html=True)
 
-top10  = df_ranks.head(10).copy()
-colors = ["#0EA5E9" if n == selected_restaurant else "#D266A5" for n in top10["name"]]
-
-fig_lb = go.Figure()
-fig_lb.add_trace(go.Bar(
-    x=top10["score"], y=top10["name"],
-    orientation="h",
-    marker=dict(color=colors, line=dict(width=0)),
-    text=[f"{s:.1f}" for s in top10["score"]],
-    textposition="inside",
-    textfont=dict(size=10, color="white", family="Space Mono"),
-    hovertemplate="%{y}: %{x:.1f}/100<extra></extra>",
-))
-fig_lb.update_layout(
-    xaxis=dict(tickfont=dict(color='#1E293B', size=10)),
-    yaxis=dict(tickfont=dict(color='#1E293B', size=10)),
-    height=290, margin=dict(l=10, r=20, t=10, b=30),
-    paper_bgcolor="white", plot_bgcolor="white", showlegend=False,
-)
-st.plotly_chart(fig_lb, use_container_width=True, config={"displayModeBar": False})
+# The bars, labels and hover text only change with the dataset; the highlighted
+# bar is the only per-selection difference, so just the colours are patched.
+@st.cache_resource(show_spinner=False)
+def leaderboard_base(data_key, _df_ranks):
+    top10 = _df_ranks.head(10)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=top10["score"], y=top10["name"],
+        orientation="h",
+        marker=dict(color="#D266A5", line=dict(width=0)),
+        text=[f"{s:.1f}" for s in top10["score"]],
+        textposition="inside",
+        textfont=dict(size=10, color="white", family=FONT_MONO),
+        hovertemplate="%{y}: %{x:.1f}/100<extra></extra>",
+    ))
+    fig.update_layout(
+        **CHART_LAYOUT,
+        xaxis=dict(tickfont=dict(color='#1E293B', size=10), gridcolor='#F1F5F9'),
+        yaxis=dict(tickfont=dict(color='#1E293B', size=10), gridcolor='#F1F5F9'),
+        height=290, margin=dict(l=10, r=20, t=10, b=30),
+        paper_bgcolor="white", plot_bgcolor="white", showlegend=False,
+    )
+    return fig, tuple(top10["name"])
+
+lb_base, top10_names = leaderboard_base(data_key, df_ranks)
+fig_lb = go.Figure(lb_base)
+fig_lb.data[0].marker.color = ["#0EA5E9" if n == selected_restaurant else "#D266A5" for n in top10_names]
+st.plotly_chart(fig_lb, use_container_width=True, theme=None, config={"displayModeBar": False})
 st.markdown("</div>", unsafe_allow_html=True)
 
 
@@ -19,10 +19,13 @@ ROOT-CAUSE FIX (v1.3):
      to call load_data.clear() from app.py when data files change.
 """
 import os
+import hashlib
+import json
 import pandas as pd
 import numpy as np
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 
 # ── Path resolution ───────────────────────────────────────────────────────────────
@@ -30,6 +33,8 @@ _UPLOAD_DIR = "/mnt/user-data/uploads"
 
 def _resolve_path(filename: str) -> str:
     """Return the first existing path for *filename*; fall back to CWD."""
+    if os.path.isabs(filename):
+        return filename        # every candidate below would be this same path
     candidates = [
         filename,                                    # relative to CWD (normal Streamlit run)
         os.path.join(os.path.dirname(__file__), filename),  # same dir as this module
@@ -42,6 +47,62 @@ def _resolve_path(filename: str) -> str:
     return filename
 
 
+# ── Parquet sidecar cache ─────────────────────────────────────────────────────────
+# The cleaned frames and benchmarks are written next to this module so a server
+# restart can skip the CSV parse and enrichment.  The key covers both source
+# paths, their mtime and size, and _CACHE_VERSION (bump it whenever the cleaning
+# pipeline changes its output).  Entries are only reused on the day they were
+# written, as recency scores are relative to "now"; older ones are pruned on the
+# next write.  Every failure here just falls back to the CSV path.
+_CACHE_DIR     = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+_CACHE_VERSION = 2
+
+def _cache_paths(restaurants_path: str, reviews_path: str) -> tuple:
+    parts = [str(_CACHE_VERSION)]
+    for p in (restaurants_path, reviews_path):
+        info = os.stat(p)
+        parts += [os.path.abspath(p), str(info.st_mtime_ns), str(info.st_size)]
+    key = hashlib.blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+    return tuple(
+        os.path.join(_CACHE_DIR, f"{key}.{part}")
+        for part in ("rest.parquet", "rev.parquet", "bench.json")
+    )
+
+
+def _read_cache(cache_paths: tuple):
+    """Return (df_rest, df_rev, benchmarks) if a same-day entry exists, else None."""
+    try:
+        rest_p, rev_p, bench_p = cache_paths
+        if datetime.fromtimestamp(os.path.getmtime(bench_p)).date() != date.today():
+            return None
+        with open(bench_p, encoding="utf-8") as f:
+            benchmarks = json.load(f)
+        return pd.read_parquet(rest_p), pd.read_parquet(rev_p), benchmarks
+    except Exception:
+        return None
+
+
+def _write_cache(cache_paths: tuple, df_rest: pd.DataFrame, df_rev: pd.DataFrame,
+                 benchmarks: dict) -> None:
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        today = date.today()
+        for entry in os.scandir(_CACHE_DIR):
+            if datetime.fromtimestamp(entry.stat().st_mtime).date() != today:
+                os.remove(entry.path)
+
+        rest_p, rev_p, bench_p = cache_paths
+        df_rest.to_parquet(rest_p + ".tmp", compression="zstd")
+        df_rev.to_parquet(rev_p + ".tmp", compression="zstd")
+        with open(bench_p + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(benchmarks, f)
+        # The benchmarks file is the entry's marker, so it is moved into place last.
+        for p in cache_paths:
+            os.replace(p + ".tmp", p)
+    except Exception:
+        pass
+
+
 # ── Public entry point ────────────────────────────────────────────────────────────
 def load_and_clean_data(
     restaurants_path: str = "restaurants.csv",
@@ -52,33 +113,58 @@ def load_and_clean_data(
     restaurants_path = _resolve_path(restaurants_path)
     reviews_path     = _resolve_path(reviews_path)
 
+    try:
+        cache_paths = _cache_paths(restaurants_path, reviews_path)
+    except OSError:
+        cache_paths = None   # missing CSV: let pandas raise its usual error below
+    cached = _read_cache(cache_paths) if cache_paths else None
+    if cached is not None:
+        return cached
+
+    now = datetime.now()   # one reference instant for every relative date in this load
     df_rest = _load_restaurants(restaurants_path)
-    df_rev  = _load_reviews(reviews_path)
-    df_rest = _enrich_restaurants(df_rest, df_rev)
+    df_rev  = _load_reviews(reviews_path, now)
+    df_rest = _enrich_restaurants(df_rest, df_rev, now)
     benchmarks = _compute_benchmarks(df_rest)
+
+    # Names are filtered on every rerun; as a categorical the equality masks
+    # compare integer codes instead of Python strings (slugs already are one).
+    if "name" in df_rest.columns:
+        df_rest["name"] = df_rest["name"].astype("category")
+
+    if cache_paths:
+        _write_cache(cache_paths, df_rest, df_rev, benchmarks)
     return df_rest, df_rev, benchmarks
 
 
+def _read_csv(path: str) -> pd.DataFrame:
+    """Parse with Arrow's multi-threaded CSV reader, falling back to the C engine
+    when pyarrow is missing or rejects the file."""
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig", engine="pyarrow")
+    except Exception:
+        return pd.read_csv(path, encoding="utf-8-sig")
+
+
 # ── Restaurant loader ─────────────────────────────────────────────────────────────
 def _load_restaurants(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path, encoding="utf-8-sig")
+    df = _read_csv(path)
 
     rating_col = find_col(df, ["rating"])
     if rating_col:
-        df["rating_n"] = (
+        # One extract accepting either decimal separator, then normalise the comma.
+        df["rating_n"] = pd.to_numeric(
             df[rating_col]
-            .astype(str)
-            .str.replace(",", ".", regex=False)
-            .str.replace("\xa0", "", regex=False)
-            .str.extract(r"(\d+\.?\d*)", expand=False)
-            .astype(float)
-            .fillna(0)
-        )
+            .pipe(_as_str)
+            .str.extract(_RATING_RE, expand=False)
+            .str.replace(",", ".", regex=False),
+            errors="coerce",
+        ).fillna(0.0)
     else:
         df["rating_n"] = 0.0
 
     rev_col = find_col(df, ["review_count", "review_co", "reviews", "rev_count"])
-    df["rev_count_n"] = df[rev_col].apply(_parse_int) if rev_col else 0
+    df["rev_count_n"] = _parse_ints(df[rev_col]) if rev_col else 0
 
     if not find_col(df, ["district"]):
         df["district"] = "Frankfurt City"
@@ -89,33 +175,53 @@ def _load_restaurants(path: str) -> pd.DataFrame:
 
 
 # ── Review loader ─────────────────────────────────────────────────────────────────
-def _load_reviews(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path, encoding="utf-8-sig")
+def _load_reviews(path: str, now: datetime = None) -> pd.DataFrame:
+    now = now or datetime.now()
+    df = _read_csv(path)
 
-    # Date parsing – prefer review_date column
+    # Date parsing – prefer review_date column.  Absolute dates in the known
+    # formats are converted column-wise first; the remaining relative phrases
+    # ("vor 2 Monaten") repeat heavily, so each distinct one is parsed once.
     date_col = find_col(df, ["review_date", "date", "review_time", "reviewer_data"])
-    df["normalized_date"] = (
-        df[date_col].apply(_parse_german_date) if date_col else datetime.now()
-    )
+    if date_col:
+        raw  = df[date_col]
+        text = _as_str(raw)
+        dates = pd.Series(pd.NaT, index=df.index, dtype="datetime64[us]")
+        for fmt in _DATE_FORMATS:
+            dates = dates.fillna(pd.to_datetime(text, format=fmt, errors="coerce"))
+        todo = dates.isna()
+        if todo.any():
+            parsed = {s: _parse_german_date(s, now) for s in raw[todo].unique()}
+            dates[todo] = raw[todo].map(parsed)
+        df["normalized_date"] = dates
+    else:
+        df["normalized_date"] = now
+    # Guarantee datetime64 here so consumers never have to re-convert per group.
+    df["normalized_date"] = pd.to_datetime(df["normalized_date"])
+    df["_mkey"] = month_keys(df["normalized_date"])
 
     # Rating – strip non-breaking spaces before numeric conversion
     rating_col = find_col(df, ["review_rating", "rating", "stars", "review_c"])
     if rating_col:
         df["review_rating"] = pd.to_numeric(
             df[rating_col]
-            .astype(str)
+            .pipe(_as_str)
             .str.replace("\xa0", "", regex=False)
             .str.strip(),
             errors="coerce",
         ).fillna(5)
+        # Whole-star ratings fit in int8; half-star data stays float64.
+        df["review_rating"] = pd.to_numeric(df["review_rating"], downcast="integer")
     else:
-        df["review_rating"] = 5
+        df["review_rating"] = np.int8(5)
 
     return df
 
 
 # ── Enrichment ────────────────────────────────────────────────────────────────────
-def _enrich_restaurants(df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> pd.DataFrame:
+def _enrich_restaurants(df_rest: pd.DataFrame, df_rev: pd.DataFrame,
+                        now: datetime = None) -> pd.DataFrame:
+    now = now or datetime.now()
     r_url = find_col(df_rest, ["page_url", "url", "link"])
     v_url = find_col(df_rev,  ["page_url", "url", "link"])
 
@@ -127,61 +233,61 @@ def _enrich_restaurants(df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> pd.DataF
     resp_content_col = find_col(df_rev, ["owner_response_content"])
     resp_flag_col    = find_col(df_rev, ["owner_response"])
 
+    # Slugs on the review frame are needed by compute_momentum even when the
+    # restaurant frame has no URL column, so they are always added here rather
+    # than lazily by consumers of the (cached, shared) frame.
+    # Both frames share one categorical dtype (the union of their slugs): the
+    # groupby below then hashes integer codes rather than strings, and slugs stay
+    # directly comparable across the two frames.
+    if v_url:
+        rev_slugs = _url_slugs(df_rev[v_url])
+        slug_cats = pd.Index(rev_slugs.unique())
+        if r_url:
+            rest_slugs = _url_slugs(df_rest[r_url])
+            slug_cats  = slug_cats.union(rest_slugs.unique())
+            df_rest["_slug"] = rest_slugs.astype(pd.CategoricalDtype(slug_cats))
+        df_rev["_slug"] = rev_slugs.astype(pd.CategoricalDtype(slug_cats))
+
     if r_url and v_url:
-        df_rest["_slug"] = df_rest[r_url].apply(_url_slug)
-        df_rev["_slug"]  = df_rev[v_url].apply(_url_slug)
-
-        rev_by_slug = {slug: grp for slug, grp in df_rev.groupby("_slug")}
-
-        rates, sm, rm = {}, {}, {}
-        c90  = datetime.now() - timedelta(days=90)
-        c180 = datetime.now() - timedelta(days=180)
-
-        for slug in df_rest["_slug"]:
-            sub = rev_by_slug.get(slug)
-            if sub is None or len(sub) == 0:
-                continue
-
-            # ── Response rate ─────────────────────────────────────────────────────
-            # A review is "responded" when the content column is non-null/non-empty
-            # OR the flag column says 'Antwort vom Inhaber' (or any non-null value).
-            responded = pd.Series([False] * len(sub), index=sub.index)
-
-            if resp_content_col and resp_content_col in sub.columns:
-                content_vals = sub[resp_content_col].astype(str).str.strip()
-                responded |= (
-                    sub[resp_content_col].notna()
-                    & (content_vals != "")
-                    & (content_vals.str.lower() != "nan")
-                )
-
-            if resp_flag_col and resp_flag_col in sub.columns:
-                flag_vals = sub[resp_flag_col].astype(str).str.strip()
-                responded |= (
-                    sub[resp_flag_col].notna()
-                    & (flag_vals != "")
-                    & (flag_vals.str.lower() != "nan")
-                )
-
-            rates[slug] = responded.sum() / len(sub)
-
-            # ── Sentiment ─────────────────────────────────────────────────────────
-            if "review_rating" in sub.columns:
-                sm[slug] = ((sub["review_rating"].mean() - 1) / 4.0) * 100
-
-            # ── Recency score ─────────────────────────────────────────────────────
-            if "normalized_date" in sub.columns:
-                d = pd.to_datetime(sub["normalized_date"])
-                rm[slug] = min(
-                    ((d > c90).sum() * 0.7 + (d > c180).sum() * 0.3) / len(sub),
-                    1.0,
-                )
-
-        df_rest["res_rate"]      = df_rest["_slug"].map(rates).fillna(0.0)
-        df_rest["sentiment"]     = df_rest["_slug"].map(sm).fillna(
-            ((df_rest["rating_n"] - 1) / 4.0) * 100
+
+        # ── Response rate ─────────────────────────────────────────────────────────
+        # A review is "responded" when the content column is non-null/non-empty
+        # OR the flag column says 'Antwort vom Inhaber' (or any non-null value).
+        responded = pd.Series(False, index=df_rev.index)
+        for col in (resp_content_col, resp_flag_col):
+            if col:
+                responded |= _non_empty(df_rev[col])
+
+        # ── Per-slug aggregates ───────────────────────────────────────────────────
+        # Both frames share the slug categories, so every per-slug sum is a single
+        # bincount over the review codes and each restaurant reads its values back
+        # by its own code.
+        c90  = now - timedelta(days=90)
+        c180 = now - timedelta(days=180)
+        d = df_rev["normalized_date"]
+        codes = df_rev["_slug"].cat.codes.to_numpy()
+        ng    = len(slug_cats)
+
+        def per_slug(weights=None):
+            return np.bincount(codes, weights=weights, minlength=ng)
+
+        n = per_slug()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res_rate = per_slug(responded.to_numpy(float)) / n
+            rating   = per_slug(df_rev["review_rating"].to_numpy(float)) / n
+            recency  = np.minimum(
+                (per_slug((d > c90).to_numpy(float)) * 0.7
+                 + per_slug((d > c180).to_numpy(float)) * 0.3) / n,
+                1.0,
+            )
+
+        rest_codes = df_rest["_slug"].cat.codes.to_numpy()
+        seen = n[rest_codes] > 0
+        df_rest["res_rate"]      = np.where(seen, res_rate[rest_codes], 0.0)
+        df_rest["sentiment"]     = np.where(
+            seen, ((rating[rest_codes] - 1) / 4.0) * 100, ((df_rest["rating_n"] - 1) / 4.0) * 100
         )
-        df_rest["recency_score"] = df_rest["_slug"].map(rm).fillna(0.5)
+        df_rest["recency_score"] = np.where(seen, recency[rest_codes], 0.5)
 
     else:
         # Fallback when URL columns are missing
@@ -193,29 +299,76 @@ def _enrich_restaurants(df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> pd.DataF
     return df_rest
 
 
+def _non_empty(col: pd.Series) -> pd.Series:
+    """True where *col* holds real text: not null, not blank and not the string 'nan'."""
+    s = col.astype("string").str.strip().str.lower()
+    return (s.notna() & s.ne("") & s.ne("nan")).fillna(False).astype(bool)
+
+
 # ── Benchmarks ────────────────────────────────────────────────────────────────────
 def _compute_benchmarks(df_rest: pd.DataFrame) -> dict:
+    rating  = df_rest["rating_n"].to_numpy(dtype=float)
+    reviews = df_rest["rev_count_n"].to_numpy(dtype=float)
+    if rating.size == 0:                      # NaN benchmarks, as pandas gives
+        rating = reviews = np.array([np.nan])
     return {
-        "rating":         float(df_rest["rating_n"].quantile(0.75)),
+        "rating":         float(np.quantile(rating, 0.75)),
         "response_rate":  0.90,
         "recency":        0.70,
-        "review_volume":  float(df_rest["rev_count_n"].quantile(0.75)),
-        "top_rating":     float(df_rest["rating_n"].max()),
-        "avg_rating":     float(df_rest["rating_n"].mean()),
-        "median_reviews": float(df_rest["rev_count_n"].median()),
+        "review_volume":  float(np.quantile(reviews, 0.75)),
+        "top_rating":     float(rating.max()),
+        "avg_rating":     float(rating.mean()),
+        "median_reviews": float(np.median(reviews)),
     }
 
 
 # ── Public helpers ────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=64)
+def _col_map(columns: tuple) -> dict:
+    """Lower-cased name -> actual name; shared per column set, so treat as read-only."""
+    return {c.lower(): c for c in columns}
+
+
 def find_col(df: pd.DataFrame, candidates: list) -> str | None:
     """Case-insensitive column lookup. Returns actual column name or None."""
-    col_map = {c.lower(): c for c in df.columns}
+    col_map = _col_map(tuple(df.columns))
     for c in candidates:
         if c.lower() in col_map:
             return col_map[c.lower()]
     return None
 
 
+_SLUG_RE  = re.compile(r"/place/([^/@]+)")
+_DIGIT_RE = re.compile(r"\d+")
+_BEARB_RE = re.compile(r"^bearbeitet:\s*")
+_TWO_RUNS_RE = re.compile(r"(\d+)\D*(\d*)")
+
+# Relative-date keyword -> (step back from today, multiplied by the number in the
+# string?).  One alternation search replaces the old if-cascade; longer phrases
+# come first so "einem monat" wins over "monat".
+_DATE_KW = {
+    "einem monat": (timedelta(days=30),  False),
+    "monat":       (timedelta(days=30),  True),
+    "einem jahr":  (timedelta(days=365), False),
+    "jahr":        (timedelta(days=365), True),
+    "einer woche": (timedelta(days=7),   False),
+    "woche":       (timedelta(days=7),   True),
+    "tag":         (timedelta(days=1),   True),
+    "stunde":      (timedelta(hours=1),  True),
+    "gestern":     (timedelta(days=1),   False),
+    "heute":       (timedelta(0),        False),
+}
+_DATE_KW_RE = re.compile("|".join(map(re.escape, _DATE_KW)))
+_DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y")
+_RATING_RE = re.compile(r"(\d+[.,]?\d*)")
+
+
+def month_keys(dates: pd.Series) -> pd.Series:
+    """Calendar month as an int32 key (year * 12 + month - 1), so monthly counts
+    are an integer bincount instead of a Period groupby.  NaT maps to -1."""
+    return (dates.dt.year * 12 + dates.dt.month - 1).fillna(-1).astype("int32")
+
+
 def _url_slug(url: str) -> str:
     """Extract the restaurant place-name slug from a Google Maps URL.
 
@@ -223,35 +376,48 @@ def _url_slug(url: str) -> str:
     e.g. '.../place/Im+Herzen+Afrikas+Frankfurt/@50.10...'
          → 'im+herzen+afrikas+frankfurt'
     """
-    m = re.search(r"/place/([^/@]+)", str(url))
+    m = _SLUG_RE.search(str(url))
     return m.group(1).lower() if m else str(url).lower()[:80]
 
 
+def _as_str(col: pd.Series) -> pd.Series:
+    """*col* as text for the .str accessor, copying only when it isn't text already."""
+    return col if pd.api.types.is_string_dtype(col) else col.astype(str)
+
+
+def _url_slugs(urls: pd.Series) -> pd.Series:
+    """Column-wise _url_slug: one regex pass over the Series instead of a call per row."""
+    s = _as_str(urls).fillna("nan")             # str(NaN) == "nan", as in _url_slug
+    return s.str.extract(_SLUG_RE, expand=False).str.lower().fillna(s.str.lower().str[:80])
+
+
 def _parse_int(x) -> int:
-    found = re.findall(r"\d+", str(x))
+    found = _DIGIT_RE.findall(str(x))
     return int("".join(found[:2])) if found else 0
 
 
-def _parse_german_date(date_str) -> datetime:
-    """Parse German relative date strings, including 'Bearbeitet: vor X …' prefix."""
-    today = datetime.now()
+def _parse_ints(col: pd.Series) -> pd.Series:
+    """Column-wise _parse_int: the first two digit runs, concatenated; 0 when none."""
+    runs = _as_str(col).str.extract(_TWO_RUNS_RE)
+    counts = pd.to_numeric(runs[0].str.cat(runs[1]), errors="coerce").fillna(0)
+    return pd.to_numeric(counts, downcast="integer")
+
+
+def _parse_german_date(date_str, now: datetime = None) -> datetime:
+    """Parse German relative date strings, including 'Bearbeitet: vor X …' prefix.
+    Relative dates count back from *now* (default: the current time)."""
+    today = now or datetime.now()
     s = str(date_str).lower()
-    s = re.sub(r"^bearbeitet:\s*", "", s).strip()
-    n_match = re.search(r"\d+", s)
-    n = int(n_match.group()) if n_match else 1
-
-    if "einem monat" in s:  return today - timedelta(days=30)
-    if "monat"       in s:  return today - timedelta(days=n * 30)
-    if "einem jahr"  in s:  return today - timedelta(days=365)
-    if "jahr"        in s:  return today - timedelta(days=n * 365)
-    if "einer woche" in s:  return today - timedelta(days=7)
-    if "woche"       in s:  return today - timedelta(days=n * 7)
-    if "tag"         in s:  return today - timedelta(days=n)
-    if "stunde"      in s:  return today - timedelta(hours=n)
-    if "gestern"     in s:  return today - timedelta(days=1)
-    if "heute"       in s:  return today
-
-    for fmt in ["%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y"]:
+    s = _BEARB_RE.sub("", s).strip()
+    kw = _DATE_KW_RE.search(s)
+    if kw:
+        step, per_n = _DATE_KW[kw.group()]
+        if not per_n:
+            return today - step
+        n_match = _DIGIT_RE.search(s)
+        return today - step * (int(n_match.group()) if n_match else 1)
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(str(date_str), fmt)
         except Exception:
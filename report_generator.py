@@ -6,23 +6,34 @@ Generates a rich 6-page Revenue Intelligence Brief PDF using reportlab + matplot
 Fix vs original: _momentum_page donut chart now uses _slug matching instead of
 exact URL string match (which always failed due to short vs long URL mismatch).
 """
-import io, math, textwrap
+import io, math, multiprocessing, os, textwrap, threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+import pandas as pd
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, white, black
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    HRFlowable, PageBreak, Image as RLImage, KeepTogether
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, TableStyle,
+    HRFlowable, PageBreak, Image as RLImage, KeepTogether, Flowable
 )
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.graphics.shapes import Drawing, Rect, Line, String, Group, Circle, Polygon
+from reportlab.graphics.charts.barcharts import VerticalBarChart, HorizontalBarChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.legends import Legend
 from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from scoring_engine import (compute_all_dimension_scores, compute_dimension_scores,
+                            rank_restaurants, get_gap_analysis, compute_momentum,
+                            get_customer_persona)
 
 # ── Brand palette ─────────────────────────────────────────────────────────────────
 CN   = HexColor('#0F172A')   # Navy
@@ -42,9 +53,16 @@ CBI  = HexColor('#EFF6FF')   # Blue-ice
 W, H = A4
 
 # ── Styles ────────────────────────────────────────────────────────────────────────
+# Styles are memoized on (name, kwargs): pages ask for the same few styles on
+# every report, often inside loops.  The returned styles are shared, so treat
+# them as read-only.
 def S(name, **kw):
+    return _style(name, tuple(sorted(kw.items())))
+
+@lru_cache(maxsize=256)
+def _style(name, kw_items):
     defaults = dict(fontName='Helvetica', fontSize=10, textColor=CN, leading=14, spaceAfter=2*mm)
-    defaults.update(kw)
+    defaults.update(kw_items)
     return ParagraphStyle(name, **defaults)
 
 STYLES = {
@@ -60,12 +78,265 @@ STYLES = {
     'Note':  S('Note',fontSize=8, textColor=CSl, leading=11, alignment=TA_JUSTIFY),
 }
 
+def _header_cmds(font_size=8.5):
+    """TableStyle commands for the dark header row shared by the data tables."""
+    return [
+        ('BACKGROUND',(0,0),(-1,0),CN),
+        ('TEXTCOLOR',(0,0),(-1,0),white),
+        ('FONTNAME',(0,0),(-1,0),'Helvetica-Bold'),
+        ('FONTSIZE',(0,0),(-1,0),font_size),
+    ]
+
+
+# ── Flowables ─────────────────────────────────────────────────────────────────────
+def _wrap_words(text, font, size, first_width, width):
+    """Greedy word wrap; the first line may be shorter (it follows a label)."""
+    space = stringWidth(' ', font, size)
+    lines, cur, used, avail = [], [], 0.0, first_width
+    for word in text.split():
+        ww = stringWidth(word, font, size)
+        if cur and used + space + ww > avail:
+            lines.append(' '.join(cur))
+            cur, used, avail = [word], ww, width
+        else:
+            used += (space if cur else 0) + ww
+            cur.append(word)
+    lines.append(' '.join(cur))
+    return lines
+
+
+class DimCard(Flowable):
+    """Dimension card for page 3, drawn straight onto the canvas.
+
+    Header row (name, score, status badge) followed by the "What it measures"
+    and "Recommended action" rows; replaces a 3x3 Table of Paragraphs.
+    """
+    PAD, HEAD_H, LEAD, SIZE = 7, 26, 12, 8.5
+    BADGE_W = 45*mm
+
+    def __init__(self, name, score, status, status_clr, badge_bg, what, action):
+        super().__init__()
+        self.name, self.score, self.status = name, score, status
+        self.status_clr, self.badge_bg = status_clr, badge_bg
+        self.rows = [("What it measures:", what, CSl, None),
+                     ("Recommended action:", action, HexColor('#0369A1'), HexColor('#F0F9FF'))]
+
+    def wrap(self, aw, ah):
+        inner = aw - 2*self.PAD
+        self._lines = []
+        for label, text, _, _ in self.rows:
+            lw = stringWidth(label + ' ', 'Helvetica-Bold', self.SIZE)
+            self._lines.append((lw, _wrap_words(text, 'Helvetica', self.SIZE, inner - lw, inner)))
+        self.width = aw
+        self.height = self.HEAD_H + sum(10 + len(ls)*self.LEAD for _, ls in self._lines)
+        return self.width, self.height
+
+    def draw(self):
+        c, w, h, pad = self.canv, self.width, self.height, self.PAD
+        bx = w - self.BADGE_W
+        top = h - self.HEAD_H
+        c.setFillColor(CLt);           c.rect(0, top, w, self.HEAD_H, fill=1, stroke=0)
+        c.setFillColor(self.badge_bg); c.rect(bx, top, self.BADGE_W, self.HEAD_H, fill=1, stroke=0)
+        base = top + self.HEAD_H/2 - 3.5
+        c.setFillColor(CN); c.setFont('Helvetica-Bold', 10)
+        c.drawString(pad, base, self.name)
+        c.setFillColor(CB); c.setFont('Helvetica-Bold', 12)
+        c.drawRightString(bx - pad, base, f"{self.score:.1f} / 100")
+        c.setFillColor(self.status_clr); c.setFont('Helvetica-Bold', 8)
+        c.drawCentredString(bx + self.BADGE_W/2, base + 0.5, self.status)
+
+        y = top
+        c.setStrokeColor(CBd); c.setLineWidth(0.4)
+        for (label, _, clr, bg), (lw, lines) in zip(self.rows, self._lines):
+            row_h = 10 + len(lines)*self.LEAD
+            if bg is not None:
+                c.setFillColor(bg); c.rect(0, y - row_h, w, row_h, fill=1, stroke=0)
+            c.line(0, y, w, y)
+            base = y - 5 - self.SIZE
+            c.setFillColor(clr)
+            c.setFont('Helvetica-Bold', self.SIZE); c.drawString(pad, base, label)
+            c.setFont('Helvetica', self.SIZE)
+            for i, line in enumerate(lines):
+                c.drawString(pad + (lw if i == 0 else 0), base - i*self.LEAD, line)
+            y -= row_h
+        c.setLineWidth(0.5); c.rect(0, 0, w, h, fill=0, stroke=1)
+        c.setStrokeColor(self.status_clr); c.setLineWidth(2); c.line(0, h, w, h)
+
+
+# ── Vector charts ─────────────────────────────────────────────────────────────────
+# Bar and donut charts are drawn with reportlab.graphics so they land in the PDF
+# as vector ops; matplotlib is only used for the velocity line.
+CBench = HexColor('#CBD5E1')   # Benchmark bars
+
+def _style_axes(chart):
+    chart.fillColor = CLt
+    chart.strokeColor = CBd
+    for axis in (chart.categoryAxis, chart.valueAxis):
+        axis.strokeColor = CBd
+        axis.labels.fontName = 'Helvetica'
+        axis.labels.fontSize = 7.5
+        axis.labels.fillColor = CN
+    chart.valueAxis.visibleGrid = 1
+    chart.valueAxis.gridStrokeColor = CBd
+    chart.valueAxis.gridStrokeWidth = 0.6
+
+def _legend(x, y, pairs, columns=1, font_size=7):
+    lg = Legend()
+    lg.x, lg.y = x, y
+    lg.alignment = 'right'
+    lg.boxAnchor = 'nw'
+    lg.fontName, lg.fontSize = 'Helvetica', font_size
+    lg.strokeColor = None
+    lg.columnMaximum = math.ceil(len(pairs) / columns)
+    lg.dx = lg.dy = 7
+    lg.deltay = font_size + 3
+    lg.colorNamePairs = pairs
+    return lg
+
+def _axis_title(x, y, text, vertical=False):
+    g = Group(String(0, 0, text, fontName='Helvetica', fontSize=8, fillColor=CN, textAnchor='middle'))
+    g.translate(x, y)
+    if vertical:
+        g.rotate(90)
+    return g
+
+
+# ── Chart figures ─────────────────────────────────────────────────────────────────
+# One Figure per chart layout, reused across reports instead of rebuilt by
+# plt.subplots each time, plus a scratch buffer to rasterize them into.  Kept
+# per thread because Streamlit sessions may build reports concurrently and a
+# Figure is not safe to draw from two threads.
+_FIG_CACHE = threading.local()
+
+def _get_cached_fig(figsize, ncols=1, width_ratios=None):
+    figs = getattr(_FIG_CACHE, 'figs', None)
+    if figs is None:
+        figs = _FIG_CACHE.figs = {}
+    key = (figsize, ncols, width_ratios)
+    if key not in figs:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        gs_kw = {'width_ratios': list(width_ratios)} if width_ratios else None
+        figs[key] = (fig, fig.subplots(1, ncols, gridspec_kw=gs_kw))
+    fig, axes = figs[key]
+    for ax in np.atleast_1d(axes):
+        ax.clear()
+    return fig, axes
+
+def _chart_image(fig, width, height):
+    """Rasterize fig into the thread's scratch buffer and wrap it as an RLImage.
+
+    The scratch buffer keeps its capacity between charts; only the final JPEG
+    bytes are copied out, since RLImage reads its source lazily at build time.
+    """
+    buf = getattr(_FIG_CACHE, 'buf', None)
+    if buf is None:
+        buf = _FIG_CACHE.buf = io.BytesIO()
+    buf.seek(0); buf.truncate()
+    fig.savefig(buf, format='JPEG', dpi=110, pil_kwargs={'quality': 85})
+    return RLImage(io.BytesIO(buf.getvalue()), width=width, height=height)
+
+def _fig_frac(ax, x, y):
+    """Data coordinates on ax -> fraction of the figure (and so of its image)."""
+    ax.get_xlim(); ax.get_ylim()   # settle autoscaled limits before transforming
+    return tuple(ax.figure.transFigure.inverted().transform(ax.transData.transform((x, y))))
+
+
+class ChartImage(Flowable):
+    """Chart raster with its text labels drawn by ReportLab on top.
+
+    labels are (fx, fy, text, font, size, colour, anchor) with fx/fy as figure
+    fractions and anchor one of 'left', 'right', 'centre'.  Keeps matplotlib's
+    text shaping out of the raster pass for titles and annotations.
+    """
+    def __init__(self, img, labels):
+        super().__init__()
+        self.img, self.labels = img, labels
+
+    def wrap(self, aw, ah):
+        self.width, self.height = self.img.drawWidth, self.img.drawHeight
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        self.img.drawOn(c, 0, 0)
+        draw = {'left': c.drawString, 'right': c.drawRightString, 'centre': c.drawCentredString}
+        for fx, fy, text, font, size, clr, anchor in self.labels:
+            c.setFont(font, size)
+            c.setFillColor(clr)
+            draw[anchor](fx * self.width, fy * self.height, text)
+
+
+# ── Benchmarks ────────────────────────────────────────────────────────────────────
+# The five dimensions in report order and their fixed benchmarks. Reputation's
+# slot is filled per report from the market rating (see _bench_vec).
+_DIMS       = ('Reputation','Responsiveness','Digital Presence','Intelligence','Visibility')
+_BENCH_VEC = np.array([0.0, 90.0, 85.0, 75.0, 70.0])
+
+# Colour and label per delta level: 0 = at/above benchmark, 1 = within 15 pts, 2 = further behind.
+_LEVEL_CLR = (CG, CA, CR)
+
+def _bench_vec(benchmarks):
+    bm = _BENCH_VEC.copy()
+    bm[0] = benchmarks.get('rating', 4.4)*20
+    return bm
+
+def _delta_levels(dt):
+    return (dt < 0).astype(int) + (dt <= -15)
+
+
+# ── Page content ──────────────────────────────────────────────────────────────────
+# Fixed copy and lookup tables used by the page builders.
+_WEIGHTS = ('30%','25%','20%','15%','10%','—')
+
+# Dimension cards on page 3: (title, what it measures, recommended action).
+_DIM_DETAILS = (
+    ('Reputation (30%)',
+     'Combines star rating quality (70%) and review volume social proof (30%). '
+     'High-volume restaurants dominate local search and inspire booking confidence.',
+     'Maintain 4.5+ star avg. Target 500+ reviews. Use post-visit follow-up automation.'),
+    ('Responsiveness (25%)',
+     'Percentage of customer reviews receiving an owner reply. '
+     '89% of consumers read owner responses before choosing a restaurant — #1 trust signal.',
+     'Target 90%+ response rate. Deploy Praxiotech AI Review Manager for 2-hour guaranteed replies.'),
+    ('Digital Presence (20%)',
+     'Website availability, phone contact, and booking infrastructure. '
+     'Complete digital profiles convert 3x more Google Maps viewers into reservations.',
+     'Verify Google Business Profile. Add booking link. Refresh photos quarterly.'),
+    ('Intelligence (15%)',
+     'Sentiment derived from review rating patterns, identifying emotional triggers '
+     '(food quality, service, ambiance) that drive repeat visits.',
+     'Monitor sentiment weekly. Address recurring negative themes within 30 days.'),
+    ('Visibility (10%)',
+     'Recency-weighted review velocity. Fresh reviews within 90 days heavily '
+     'influence Google Maps ranking algorithms.',
+     'Launch SMS post-visit campaign. Target 3-5 new reviews per week.'),
+)
+
+_CARD_BG = (HexColor('#DCFCE7'), HexColor('#FEF3C7'), HexColor('#FEE2E2'))
+_CARD_STATUS = ('STRENGTH', 'OPPORTUNITY', 'CRITICAL GAP')
+
+# Gap page: Praxiotech solution per dimension and the target score it aims for.
+_PRX_MAP = {
+    'Reputation':       ('Review Velocity Campaign',    '80 EUR/mo',  '45 days',  '+12-18 pts'),
+    'Responsiveness':   ('AI Review Manager',           '120 EUR/mo', '14 days',  '+25-40 pts'),
+    'Digital Presence': ('Profile Optimization',        '60 EUR/mo',  '7 days',   '+15-25 pts'),
+    'Intelligence':     ('Sentiment Monitoring',        '80 EUR/mo',  '30 days',  '+10-20 pts'),
+    'Visibility':       ('Engagement Booster',          '60 EUR/mo',  '30 days',  '+10-15 pts'),
+}
+_GAP_TARGETS = {'Reputation':90,'Responsiveness':90,'Digital Presence':90,'Intelligence':80,'Visibility':85}
+
+_DONUT_CLRS = tuple(HexColor(c) for c in ('#22C55E','#86EFAC','#FCD34D','#FCA5A5','#EF4444'))
+
 
 # ── Public entry point ────────────────────────────────────────────────────────────
 def generate_pdf_report(res_name, res_data, scores, gaps, momentum_data,
-                        persona, benchmarks, df_rest, df_rev, rank, total):
+                        persona, benchmarks, df_rest, df_rev, rank, total, rev_rows=None):
+    """rev_rows (slug -> positional review rows, built once per dataset) lets the
+    momentum page pick the restaurant's reviews without scanning df_rev."""
+    rec = _res_record(res_data)
     buf = io.BytesIO()
-    doc = SimpleDocTemplate(
+    doc = _BriefDocTemplate(
         buf, pagesize=A4,
         rightMargin=16*mm, leftMargin=16*mm,
         topMargin=14*mm,   bottomMargin=14*mm,
@@ -73,54 +344,142 @@ def generate_pdf_report(res_name, res_data, scores, gaps, momentum_data,
         author="Praxiotech Intelligence Engine v1.2"
     )
     story = []
-    story += _cover(res_name, res_data, scores, rank, total)
+    story += _cover(res_name, rec, scores, rank, total)
     story.append(PageBreak())
-    story += _exec_summary(res_name, res_data, scores, gaps, rank, total, persona, benchmarks)
+    story += _exec_summary(res_name, rec, scores, gaps, rank, total, persona, benchmarks)
     story.append(PageBreak())
     story += _dimension_page(res_name, scores, benchmarks)
     story.append(PageBreak())
     story += _gap_page(res_name, scores, gaps, benchmarks, rank, total)
     story.append(PageBreak())
-    story += _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev)
+    story += _momentum_page(res_name, rec, scores, momentum_data, df_rev, rev_rows)
     story.append(PageBreak())
     story += _action_page(res_name, scores, gaps, persona)
 
-    doc.build(story, onFirstPage=_chrome, onLaterPages=_chrome)
+    doc.build(story)
     buf.seek(0)
     return buf.read()
 
 
+def _res_record(res_data):
+    """The restaurant fields the pages read, coerced once into a plain dict
+    (missing or empty numbers become 0) and shared by every page builder."""
+    get = res_data.get
+    return {
+        'rating_n':    float(get('rating_n', 0) or 0),
+        'rev_count_n': int(get('rev_count_n', 0) or 0),
+        'res_rate':    float(get('res_rate', 0) or 0),
+        '_slug':       get('_slug'),
+    }
+
+
+def generate_all_reports(names, df_rest, df_rev, benchmarks, max_workers=None):
+    """Build the brief for every restaurant in names across a process pool.
+
+    Returns {name: pdf_bytes}.  Names with no row in df_rest are skipped and
+    left out of the result, so one bad name cannot abort the pool and lose the
+    other reports; repeated names are built once.  The frames are pickled once
+    per worker (through the pool initializer) rather than once per task; each
+    worker then reuses its own score table, name index and review-row map.
+    Workers are spawned, not forked, since matplotlib is not fork-safe on every
+    platform.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=ctx,
+                             initializer=_init_batch_worker,
+                             initargs=(df_rest, df_rev, benchmarks)) as pool:
+        pdfs = pool.map(_batch_report, names, chunksize=4)
+        return {n: pdf for n, pdf in zip(names, pdfs) if pdf is not None}
+
+
+_BATCH = {}
+
+def _init_batch_worker(df_rest, df_rev, benchmarks):
+    ranks = rank_restaurants(compute_all_dimension_scores(df_rest, df_rev))
+    _BATCH.update(
+        df_rest=df_rest, df_rev=df_rev, benchmarks=benchmarks,
+        by_name=df_rest.drop_duplicates('name').set_index('name', drop=False),
+        rank=dict(zip(ranks['name'], ranks['rank'])),
+        rev_rows=(df_rev.groupby('_slug', sort=False, observed=True).indices
+                  if '_slug' in df_rev.columns else None),
+    )
+
+def _batch_report(name):
+    """One batch brief, or None when name has no scored row in df_rest."""
+    b = _BATCH
+    if name not in b['rank']:
+        return None
+    df_rest, df_rev, benchmarks = b['df_rest'], b['df_rev'], b['benchmarks']
+    scores   = compute_dimension_scores(name, df_rest, df_rev)
+    gaps     = get_gap_analysis(scores, benchmarks)
+    momentum = compute_momentum(name, df_rev, df_rest, b['rev_rows'])
+    persona  = get_customer_persona(name, df_rest, df_rev)
+    return generate_pdf_report(name, b['by_name'].loc[name], scores, gaps, momentum,
+                               persona, benchmarks, df_rest, df_rev,
+                               b['rank'][name], len(b['rank']), b['rev_rows'])
+
+
 # ── Page chrome ───────────────────────────────────────────────────────────────────
-def _chrome(canvas, doc):
+class _BriefDocTemplate(BaseDocTemplate):
+    """Cover template for page 1, then the inner template for every later page."""
+    def __init__(self, filename, **kw):
+        super().__init__(filename, **kw)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([
+            PageTemplate('cover', [frame], onPage=_cover_chrome, autoNextPageTemplate='inner'),
+            PageTemplate('inner', [frame], onPage=_inner_chrome),
+        ])
+        self.generated = datetime.now().strftime('%d %b %Y')
+
+
+def _cover_chrome(canvas, doc):
     canvas.saveState()
-    pg = canvas.getPageNumber()
-    if pg == 1:
-        canvas.setFillColor(CN)
-        canvas.rect(0, 0, W, H, fill=1, stroke=0)
-        canvas.setFillColor(CB)
-        canvas.rect(0, H-8, W, 8, fill=1, stroke=0)
-        canvas.setFillColor(CDB)
-        canvas.rect(0, 0, W, 55, fill=1, stroke=0)
-    else:
+    canvas.setFillColor(CN)
+    canvas.rect(0, 0, W, H, fill=1, stroke=0)
+    canvas.setFillColor(CB)
+    canvas.rect(0, H-8, W, 8, fill=1, stroke=0)
+    canvas.setFillColor(CDB)
+    canvas.rect(0, 0, W, 55, fill=1, stroke=0)
+    canvas.restoreState()
+
+
+def _inner_chrome(canvas, doc):
+    # Header/footer bars and their fixed text are identical on every inner page,
+    # so they are recorded once per document as a form XObject and reused.
+    canvas.saveState()
+    if not canvas.hasForm('chrome'):
+        canvas.beginForm('chrome')
         canvas.setFillColor(CN)
         canvas.rect(0, H-11, W, 11, fill=1, stroke=0)
+        canvas.setFillColor(CBd)
+        canvas.rect(0, 0, W, 12, fill=1, stroke=0)
         canvas.setFont('Helvetica-Bold', 7)
         canvas.setFillColor(white)
         canvas.drawString(16*mm, H-7.5, "REVENUE INTELLIGENCE BRIEF  |  PRAXIOTECH")
-        canvas.drawRightString(W-16*mm, H-7.5, f"CONFIDENTIAL  ·  PAGE {pg} OF 6")
-        canvas.setFillColor(CBd)
-        canvas.rect(0, 0, W, 12, fill=1, stroke=0)
         canvas.setFont('Helvetica', 7)
         canvas.setFillColor(CSl)
-        canvas.drawString(16*mm, 4, f"Generated: {datetime.now().strftime('%d %b %Y')}  ·  Intelligence Engine v1.2  ·  Frankfurt Dining Audit")
+        canvas.drawString(16*mm, 4, f"Generated: {doc.generated}  ·  Intelligence Engine v1.2  ·  Frankfurt Dining Audit")
         canvas.drawRightString(W-16*mm, 4, "For Internal Sales Use Only  ·  © Praxiotech GmbH")
+        canvas.endForm()
+    canvas.doForm('chrome')
+    canvas.setFont('Helvetica-Bold', 7)
+    canvas.setFillColor(white)
+    canvas.drawRightString(W-16*mm, H-7.5, f"CONFIDENTIAL  ·  PAGE {canvas.getPageNumber()} OF 6")
     canvas.restoreState()
 
 
 # ══════════════════════════════════════════════════════════════════════════════════
 # PAGE 1 – COVER
 # ══════════════════════════════════════════════════════════════════════════════════
-def _cover(res_name, res_data, scores, rank, total):
+_COVER_TITLE = tuple(
+    (txt, S('CoverT', fontName='Helvetica-Bold', fontSize=48, textColor=clr, leading=50, spaceAfter=0))
+    for txt, clr in (("REVENUE", white), ("INTELLIGENCE", CB), ("BRIEF", white))
+)
+
+def _cover(res_name, rec, scores, rank, total):
     story = [Spacer(1, 35*mm)]
 
     badge = Table([["  INTELLIGENCE ENGINE ACTIVE v1.2  "]])
@@ -136,9 +495,8 @@ def _cover(res_name, res_data, scores, rank, total):
     story.append(badge)
     story.append(Spacer(1, 7*mm))
 
-    for txt, clr, sz in [("REVENUE", white, 48), ("INTELLIGENCE", CB, 48), ("BRIEF", white, 48)]:
-        story.append(Paragraph(txt, S('CoverT', fontName='Helvetica-Bold', fontSize=sz,
-                                      textColor=clr, leading=50, spaceAfter=0)))
+    for txt, st in _COVER_TITLE:
+        story.append(Paragraph(txt, st))
     story.append(Spacer(1, 4*mm))
     story.append(HRFlowable(width='100%', thickness=1, color=CDB, spaceAfter=4*mm))
     story.append(Paragraph(res_name,
@@ -149,7 +507,7 @@ def _cover(res_name, res_data, scores, rank, total):
     h = scores['Composite']
     kd = [
         ["HEALTH SCORE","DISTRICT RANK","STAR RATING","RESPONSIVENESS"],
-        [f"{h:.1f}/100", f"#{rank}/{total}", f"{float(res_data.get('rating_n',0)):.1f} *",
+        [f"{h:.1f}/100", f"#{rank}/{total}", f"{rec['rating_n']:.1f} *",
          f"{scores['Responsiveness']:.0f}%"]
     ]
     kt = Table(kd, colWidths=[44*mm]*4)
@@ -182,14 +540,12 @@ def _cover(res_name, res_data, scores, rank, total):
 # ══════════════════════════════════════════════════════════════════════════════════
 # PAGE 2 – EXECUTIVE SUMMARY + SCORECARD
 # ══════════════════════════════════════════════════════════════════════════════════
-def _exec_summary(res_name, res_data, scores, gaps, rank, total, persona, benchmarks):
+def _exec_summary(res_name, rec, scores, gaps, rank, total, persona, benchmarks):
     story = [Spacer(1, 5*mm)]
     story.append(Paragraph("01 / Executive Summary", STYLES['H1']))
     story.append(HRFlowable(width='100%', thickness=2, color=CB, spaceAfter=3*mm))
 
-    rating    = float(res_data.get('rating_n', 0) or 0)
-    rev_count = int(res_data.get('rev_count_n', 0) or 0)
-    res_rate  = float(res_data.get('res_rate', 0) or 0)
+    rating, rev_count, res_rate = rec['rating_n'], rec['rev_count_n'], rec['res_rate']
     health    = scores['Composite']
 
     story.append(Paragraph(
@@ -222,49 +578,36 @@ def _exec_summary(res_name, res_data, scores, gaps, rank, total, persona, benchm
 
     story.append(Paragraph("Performance Scorecard", STYLES['H2']))
 
-    bench_map = {
-        'Reputation':       benchmarks.get('rating', 4.4)*20,
-        'Responsiveness':   90.0,
-        'Digital Presence': 85.0,
-        'Intelligence':     75.0,
-        'Visibility':       70.0,
-        'COMPOSITE':        75.0,
-    }
-    dims = ['Reputation','Responsiveness','Digital Presence','Intelligence','Visibility','COMPOSITE']
-    wts  = ['30%','25%','20%','15%','10%','—']
-    vals = [scores[d if d != 'COMPOSITE' else 'Composite'] for d in dims]
-
-    hrow = [Paragraph(t, STYLES['TH']) for t in ['Dimension','Weight','Score /100','Benchmark','Delta','Status']]
-    rows = [hrow]
-    for i, dim in enumerate(dims):
-        sc  = vals[i]
-        bv  = bench_map[dim]
-        dt  = sc - bv
-        ds  = f"+{dt:.1f}" if dt >= 0 else f"{dt:.1f}"
-        dc  = CG if dt >= 0 else CR
-        st  = 'STRENGTH' if dt >= 0 else ('OPPORTUNITY' if dt > -15 else 'CRITICAL')
-        bold = dim == 'COMPOSITE'
-        fn   = 'Helvetica-Bold' if bold else 'Helvetica'
-        rows.append([
-            Paragraph(f"<b>{dim}</b>" if bold else dim, S('td',fontName=fn,fontSize=9,textColor=CN)),
-            Paragraph(wts[i], S('tdC',fontName=fn,fontSize=9,textColor=CSl,alignment=TA_CENTER)),
-            Paragraph(f"<b>{sc:.1f}</b>", S('tdSc',fontName='Helvetica-Bold',fontSize=11,textColor=CB,alignment=TA_CENTER)),
-            Paragraph(f"{bv:.0f}", S('tdB',fontSize=9,textColor=CSl,alignment=TA_CENTER)),
-            Paragraph(f"<b>{ds}</b>", S('tdD',fontName='Helvetica-Bold',fontSize=9,textColor=dc,alignment=TA_CENTER)),
-            Paragraph(f"<b>{st}</b>",  S('tdSt',fontName='Helvetica-Bold',fontSize=8,textColor=white,alignment=TA_CENTER)),
-        ])
+    dims = _DIMS + ('COMPOSITE',)
+    vals = np.array([scores[d] for d in _DIMS] + [scores['Composite']])
+    bvs  = np.append(_bench_vec(benchmarks), 75.0)
+    dts  = vals - bvs
+    lvls = _delta_levels(dts)
+    sts  = np.array(['STRENGTH','OPPORTUNITY','CRITICAL'])[lvls]
 
-    st_styles = []
+    rows = [['Dimension','Weight','Score /100','Benchmark','Delta','Status']]
+    cell_styles = []
     for i, dim in enumerate(dims):
-        sc = vals[i]; bv = bench_map[dim]; dt = sc-bv
-        bg = CG if dt >= 0 else (CA if dt > -15 else CR)
-        st_styles.append(('BACKGROUND',(5,i+1),(5,i+1),bg))
+        dt  = dts[i]
+        rows.append([dim, _WEIGHTS[i], f"{vals[i]:.1f}", f"{bvs[i]:.0f}", f"{dt:+.1f}", sts[i]])
+        cell_styles += [('TEXTCOLOR',(4,i+1),(4,i+1),CG if dt >= 0 else CR),
+                        ('BACKGROUND',(5,i+1),(5,i+1),_LEVEL_CLR[lvls[i]])]
 
     sc_table = Table(rows, colWidths=[52*mm,18*mm,24*mm,26*mm,20*mm,25*mm], repeatRows=1)
-    sc_table.setStyle(TableStyle([
-        ('BACKGROUND',(0,0),(-1,0),CN),
-        ('FONTSIZE',(0,0),(-1,0),8.5),
-        ('ALIGN',(0,0),(-1,-1),'LEFT'),
+    sc_table.setStyle(TableStyle(_header_cmds() + [
+        ('FONTSIZE',(0,1),(-1,-1),9),
+        ('TEXTCOLOR',(0,1),(0,-1),CN),
+        ('TEXTCOLOR',(1,1),(1,-1),CSl),
+        ('TEXTCOLOR',(3,1),(3,-1),CSl),
+        ('FONTNAME',(2,1),(2,-1),'Helvetica-Bold'),
+        ('FONTSIZE',(2,1),(2,-1),11),
+        ('TEXTCOLOR',(2,1),(2,-1),CB),
+        ('FONTNAME',(4,1),(5,-1),'Helvetica-Bold'),
+        ('FONTSIZE',(5,1),(5,-1),8),
+        ('TEXTCOLOR',(5,1),(5,-1),white),
+        ('FONTNAME',(0,-1),(1,-1),'Helvetica-Bold'),
+        ('ALIGN',(0,0),(-1,0),'CENTER'),
+        ('ALIGN',(1,1),(-1,-1),'CENTER'),
         ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
         ('TOPPADDING',(0,0),(-1,-1),6), ('BOTTOMPADDING',(0,0),(-1,-1),6),
         ('ROWBACKGROUNDS',(0,1),(-1,-2),[white,CLt]),
@@ -272,7 +615,7 @@ def _exec_summary(res_name, res_data, scores, gaps, rank, total, persona, benchm
         ('LINEABOVE',(0,6),(-1,6),1.5,CB),
         ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
         ('BOX',(0,0),(-1,-1),0.5,CBd),
-    ] + st_styles))
+    ] + cell_styles))
     story.append(sc_table)
     story.append(Spacer(1, 4*mm))
 
@@ -310,80 +653,38 @@ def _dimension_page(res_name, scores, benchmarks):
     story.append(Spacer(1, 3*mm))
 
     dims     = ['Reputation','Responsiveness','Digital\nPresence','Intelligence','Visibility']
-    sc_vals  = [scores['Reputation'], scores['Responsiveness'], scores['Digital Presence'],
-                scores['Intelligence'], scores['Visibility']]
-    bm_vals  = [benchmarks.get('rating',4.4)*20, 90, 85, 75, 70]
-    bar_clrs = ['#22C55E' if sc_vals[i] >= bm_vals[i] else '#EF4444' for i in range(5)]
-
-    fig, ax = plt.subplots(figsize=(7.2, 2.9))
-    x = np.arange(5)
-    w = 0.36
-    b1 = ax.bar(x - w/2, sc_vals, w, color=bar_clrs, zorder=3, label='Score')
-    b2 = ax.bar(x + w/2, bm_vals, w, color='#CBD5E1', zorder=3, label='Benchmark')
-    ax.set_xticks(x); ax.set_xticklabels(dims, fontsize=9)
-    ax.set_ylim(0, 115); ax.set_ylabel('Score', fontsize=9)
-    ax.set_facecolor('#F8FAFC'); fig.patch.set_facecolor('#FFFFFF')
-    ax.yaxis.grid(True, color='#E2E8F0', linewidth=0.6, zorder=0)
-    ax.set_axisbelow(True)
-    for spine in ax.spines.values(): spine.set_color('#E2E8F0')
-    for bar, v in zip(b1, sc_vals):
-        ax.text(bar.get_x()+bar.get_width()/2, bar.get_height()+1.5, f"{v:.0f}",
-                ha='center', va='bottom', fontsize=8.5, fontweight='bold', color='#0F172A')
-    ax.legend(loc='upper right', fontsize=8, framealpha=0.8)
-    plt.tight_layout()
-    img_buf = io.BytesIO(); fig.savefig(img_buf, format='PNG', dpi=140, bbox_inches='tight'); plt.close(fig)
-    img_buf.seek(0)
-    story.append(RLImage(img_buf, width=168*mm, height=68*mm))
+    sc_vals  = np.array([scores[d] for d in _DIMS])
+    bm_vals  = _bench_vec(benchmarks)
+    lvls     = _delta_levels(sc_vals - bm_vals)
+    bar_clrs = np.where(lvls == 0, '#22C55E', '#EF4444').tolist()
+
+    d  = Drawing(168*mm, 68*mm)
+    bc = VerticalBarChart()
+    bc.x, bc.y, bc.width, bc.height = 38, 34, 168*mm - 48, 68*mm - 44
+    bc.data = [sc_vals.tolist(), bm_vals.tolist()]
+    bc.valueAxis.valueMin, bc.valueAxis.valueMax, bc.valueAxis.valueStep = 0, 115, 20
+    bc.categoryAxis.categoryNames = dims
+    bc.categoryAxis.labels.dy = -3
+    bc.groupSpacing, bc.barSpacing = 10, 0
+    _style_axes(bc)
+    bc.bars.strokeColor = None
+    bc.bars[1].fillColor = CBench
+    for i, clr in enumerate(bar_clrs):
+        bc.bars[(0, i)].fillColor = HexColor(clr)
+    bc.barLabelFormat = 'values'
+    bc.barLabelArray = [[f"{v:.0f}" for v in sc_vals], [''] * len(sc_vals)]
+    bc.barLabels.fontName, bc.barLabels.fontSize = 'Helvetica-Bold', 8
+    bc.barLabels.fillColor = CN
+    bc.barLabels.nudge = 6
+    d.add(bc)
+    d.add(_axis_title(14, bc.y + bc.height/2, 'Score', vertical=True))
+    d.add(_legend(bc.x + bc.width - 62, bc.y + bc.height - 4, [(CG, 'Score'), (CBench, 'Benchmark')]))
+    story.append(d)
     story.append(Spacer(1, 4*mm))
 
-    dim_details = [
-        ('Reputation (30%)',       scores['Reputation'],       benchmarks.get('rating',4.4)*20,
-         'Combines star rating quality (70%) and review volume social proof (30%). '
-         'High-volume restaurants dominate local search and inspire booking confidence.',
-         'Maintain 4.5+ star avg. Target 500+ reviews. Use post-visit follow-up automation.'),
-        ('Responsiveness (25%)',   scores['Responsiveness'],   90,
-         'Percentage of customer reviews receiving an owner reply. '
-         '89% of consumers read owner responses before choosing a restaurant — #1 trust signal.',
-         'Target 90%+ response rate. Deploy Praxiotech AI Review Manager for 2-hour guaranteed replies.'),
-        ('Digital Presence (20%)', scores['Digital Presence'], 85,
-         'Website availability, phone contact, and booking infrastructure. '
-         'Complete digital profiles convert 3x more Google Maps viewers into reservations.',
-         'Verify Google Business Profile. Add booking link. Refresh photos quarterly.'),
-        ('Intelligence (15%)',     scores['Intelligence'],     75,
-         'Sentiment derived from review rating patterns, identifying emotional triggers '
-         '(food quality, service, ambiance) that drive repeat visits.',
-         'Monitor sentiment weekly. Address recurring negative themes within 30 days.'),
-        ('Visibility (10%)',       scores['Visibility'],       70,
-         'Recency-weighted review velocity. Fresh reviews within 90 days heavily '
-         'influence Google Maps ranking algorithms.',
-         'Launch SMS post-visit campaign. Target 3-5 new reviews per week.'),
-    ]
-
-    for name, sc, bv, what, action in dim_details:
-        dt = sc - bv
-        bg  = HexColor('#DCFCE7') if dt >= 0 else (HexColor('#FEF3C7') if dt > -15 else HexColor('#FEE2E2'))
-        tc  = CG if dt >= 0 else (CA if dt > -15 else CR)
-        st  = 'STRENGTH' if dt >= 0 else ('OPPORTUNITY' if dt > -15 else 'CRITICAL GAP')
-        card = Table([
-            [Paragraph(f"<b>{name}</b>", S('dh',fontName='Helvetica-Bold',fontSize=10,textColor=CN)),
-             Paragraph(f"<b>{sc:.1f} / 100</b>", S('dsv',fontName='Helvetica-Bold',fontSize=12,textColor=CB,alignment=TA_RIGHT)),
-             Paragraph(f"<b>{st}</b>", S('dst',fontName='Helvetica-Bold',fontSize=8,textColor=tc,alignment=TA_CENTER))],
-            [Paragraph(f"<b>What it measures:</b> {what}", STYLES['Small']), '', ''],
-            [Paragraph(f"<b>Recommended action:</b> {action}",
-                        S('act',fontSize=8.5,textColor=HexColor('#0369A1'),leading=12)), '', ''],
-        ], colWidths=[88*mm, 42*mm, 45*mm])
-        card.setStyle(TableStyle([
-            ('BACKGROUND',(0,0),(-1,0),HexColor('#F8FAFC')),
-            ('BACKGROUND',(2,0),(2,0),bg),
-            ('BACKGROUND',(0,2),(-1,2),HexColor('#F0F9FF')),
-            ('SPAN',(0,1),(-1,1)),('SPAN',(0,2),(-1,2)),
-            ('LINEABOVE',(0,0),(-1,0),2,tc),
-            ('BOX',(0,0),(-1,-1),0.5,CBd),
-            ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
-            ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-            ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
-            ('LEFTPADDING',(0,0),(-1,-1),7),('RIGHTPADDING',(0,0),(-1,-1),7),
-        ]))
+    for (name, what, action), sc, lv in zip(_DIM_DETAILS, sc_vals, lvls):
+        bg, tc, st = _CARD_BG[lv], _LEVEL_CLR[lv], _CARD_STATUS[lv]
+        card = DimCard(name, sc, st, tc, bg, what, action)
         story.append(card)
         story.append(Spacer(1, 2*mm))
     return story
@@ -403,76 +704,92 @@ def _gap_page(res_name, scores, gaps, benchmarks, rank, total):
         STYLES['Body']))
     story.append(Spacer(1, 3*mm))
 
-    dims   = ['Reputation','Responsiveness','Digital Presence','Intelligence','Visibility']
-    scores_list = [scores[d] for d in dims]
-    bench_list  = [benchmarks.get('rating',4.4)*20, 90, 85, 75, 70]
-
-    fig, ax = plt.subplots(figsize=(7.2, 2.8))
-    y   = np.arange(len(dims))
-    clrs = ['#22C55E' if scores_list[i] >= bench_list[i] else '#EF4444' for i in range(len(dims))]
-    bars = ax.barh(y, scores_list, color=clrs, height=0.45, zorder=3)
-    ax.barh(y, bench_list, color='#CBD5E1', height=0.45, alpha=0.35, zorder=2, label='Benchmark')
-    ax.set_yticks(y)
-    ax.set_yticklabels(['Reputation','Responsiveness','Digital Pres.','Intelligence','Visibility'], fontsize=9)
-    ax.set_xlim(0, 110); ax.set_xlabel('Score', fontsize=9)
-    ax.set_facecolor('#F8FAFC'); fig.patch.set_facecolor('#FFFFFF')
-    ax.xaxis.grid(True, color='#E2E8F0', linewidth=0.6, zorder=0)
-    ax.set_axisbelow(True)
-    for spine in ax.spines.values(): spine.set_color('#E2E8F0')
-    for bar, sc in zip(bars, scores_list):
-        ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                f"{sc:.0f}", va='center', fontsize=8.5, fontweight='bold', color='#0F172A')
+    dims   = _DIMS
+    scores_list = np.array([scores[d] for d in dims])
+    bench_list  = _bench_vec(benchmarks)
+
+    clrs = np.where(scores_list >= bench_list, '#22C55E', '#EF4444').tolist()
+    d  = Drawing(168*mm, 65*mm)
+    bc = HorizontalBarChart()
+    bc.x, bc.y, bc.width, bc.height = 78, 30, 168*mm - 88, 65*mm - 40
+    bc.data = [scores_list.tolist()]
+    bc.valueAxis.valueMin, bc.valueAxis.valueMax, bc.valueAxis.valueStep = 0, 110, 20
+    bc.categoryAxis.categoryNames = ['Reputation','Responsiveness','Digital Pres.','Intelligence','Visibility']
+    bc.barWidth, bc.groupSpacing = 9, 11    # bar fills 45% of each row
+    _style_axes(bc)
+    bc.categoryAxis.labels.fontSize = 8.5
+    bc.bars.strokeColor = None
+    for i, clr in enumerate(clrs):
+        bc.bars[(0, i)].fillColor = HexColor(clr)
+    bc.barLabelFormat = '%.0f'
+    bc.barLabels.fontName, bc.barLabels.fontSize = 'Helvetica-Bold', 8
+    bc.barLabels.fillColor = CN
+    bc.barLabels.boxAnchor = 'w'
+    bc.barLabels.dx = 3
+    # Benchmark: a faint full-length bar behind each score plus a dark marker.
+    # Rows are evenly spaced bottom-up, so positions follow from the axis ranges.
+    row_h  = bc.height / len(dims)
+    bar_h  = row_h * 0.45
+    scale  = bc.width / bc.valueAxis.valueMax
+    ghosts = Group()
+    for i, bv in enumerate(bench_list):
+        cy = bc.y + (i + 0.5) * row_h
+        ghosts.add(Rect(bc.x, cy - bar_h/2, bv*scale, bar_h, fillColor=CBench,
+                        fillOpacity=0.35, strokeColor=None))
+    d.add(Rect(bc.x, bc.y, bc.width, bc.height, fillColor=CLt, strokeColor=CBd, strokeWidth=0.5))
+    bc.fillColor = None
+    d.add(ghosts)
+    d.add(bc)
     for i, bv in enumerate(bench_list):
-        ax.vlines(bv, i-0.3, i+0.3, colors='#0F172A', linewidth=1.8, zorder=4)
-    ax.legend(fontsize=8, framealpha=0.8)
-    plt.tight_layout()
-    img_buf = io.BytesIO(); fig.savefig(img_buf, format='PNG', dpi=140, bbox_inches='tight'); plt.close(fig)
-    img_buf.seek(0)
-    story.append(RLImage(img_buf, width=168*mm, height=65*mm))
+        cy = bc.y + (i + 0.5) * row_h
+        d.add(Line(bc.x + bv*scale, cy - row_h*0.3, bc.x + bv*scale, cy + row_h*0.3,
+                   strokeColor=CN, strokeWidth=1.8))
+    d.add(_axis_title(bc.x + bc.width/2, 6, 'Score'))
+    d.add(_legend(bc.x + bc.width - 58, bc.y + bc.height - 4, [(CBench, 'Benchmark')]))
+    story.append(d)
     story.append(Spacer(1, 4*mm))
 
     story.append(Paragraph("Gap Analysis Summary & Praxiotech Solutions", STYLES['H2']))
-    prx_map = {
-        'Reputation':       ('Review Velocity Campaign',    '80 EUR/mo',  '45 days',  '+12-18 pts'),
-        'Responsiveness':   ('AI Review Manager',           '120 EUR/mo', '14 days',  '+25-40 pts'),
-        'Digital Presence': ('Profile Optimization',        '60 EUR/mo',  '7 days',   '+15-25 pts'),
-        'Intelligence':     ('Sentiment Monitoring',        '80 EUR/mo',  '30 days',  '+10-20 pts'),
-        'Visibility':       ('Engagement Booster',          '60 EUR/mo',  '30 days',  '+10-15 pts'),
-    }
-    tgts = {'Reputation':90,'Responsiveness':90,'Digital Presence':90,'Intelligence':80,'Visibility':85}
-
-    hrow = [Paragraph(t, STYLES['TH']) for t in
-            ['Dimension','Current','Target','Gap','Praxiotech Solution','Investment','Timeline','Est. Lift']]
-    rows = [hrow]
-    for dim in dims:
-        sc  = scores[dim]; tgt = tgts[dim]; gv = tgt - sc
-        sol, inv, tm, lift = prx_map[dim]
-        gc  = CR if gv > 15 else (CA if gv > 0 else CG)
+
+    tgt_vals = np.array([_GAP_TARGETS[d] for d in dims])
+    gap_vals = tgt_vals - scores_list
+    gap_lvls = (gap_vals > 0).astype(int) + (gap_vals > 15)
+
+    rows = [['Dimension','Current','Target','Gap','Praxiotech Solution','Investment','Timeline','Est. Lift']]
+    gap_styles = []
+    for i, dim in enumerate(dims, start=1):
+        gv  = gap_vals[i-1]
+        sol, inv, tm, lift = _PRX_MAP[dim]
         gs  = f"+{gv:.0f}" if gv > 0 else f"{gv:.0f}"
-        rows.append([
-            Paragraph(dim, S('gtl',fontSize=9,textColor=CN)),
-            Paragraph(f"{sc:.0f}%", S('gtc',fontName='Helvetica-Bold',fontSize=9,textColor=CB,alignment=TA_CENTER)),
-            Paragraph(f"{tgt}%",  S('gtc2',fontSize=9,textColor=CSl,alignment=TA_CENTER)),
-            Paragraph(f"<b>{gs}</b>", S('gtg',fontName='Helvetica-Bold',fontSize=9,textColor=gc,alignment=TA_CENTER)),
-            Paragraph(sol, S('gts',fontSize=8.5,textColor=CN)),
-            Paragraph(f"<b>{inv}</b>", S('gti',fontName='Helvetica-Bold',fontSize=9,textColor=CT,alignment=TA_CENTER)),
-            Paragraph(tm, S('gtt',fontSize=8.5,textColor=CSl,alignment=TA_CENTER)),
-            Paragraph(f"<b>{lift}</b>", S('gtlf',fontName='Helvetica-Bold',fontSize=9,textColor=CG,alignment=TA_CENTER)),
-        ])
+        rows.append([dim, f"{scores_list[i-1]:.0f}%", f"{tgt_vals[i-1]}%", gs, sol, inv, tm, lift])
+        gap_styles.append(('TEXTCOLOR',(3,i),(3,i),_LEVEL_CLR[gap_lvls[i-1]]))
 
     gt = Table(rows, colWidths=[28*mm,16*mm,14*mm,12*mm,40*mm,22*mm,17*mm,22*mm], repeatRows=1)
-    gt.setStyle(TableStyle([
-        ('BACKGROUND',(0,0),(-1,0),CN),
-        ('FONTSIZE',(0,0),(-1,0),8),
+    gt.setStyle(TableStyle(_header_cmds() + [
+        ('FONTSIZE',(0,1),(-1,-1),9),
+        ('FONTSIZE',(4,1),(4,-1),8.5),
+        ('FONTSIZE',(6,1),(6,-1),8.5),
+        ('TEXTCOLOR',(0,1),(0,-1),CN),
+        ('TEXTCOLOR',(4,1),(4,-1),CN),
+        ('TEXTCOLOR',(1,1),(1,-1),CB),
+        ('TEXTCOLOR',(2,1),(2,-1),CSl),
+        ('TEXTCOLOR',(6,1),(6,-1),CSl),
+        ('TEXTCOLOR',(5,1),(5,-1),CT),
+        ('TEXTCOLOR',(7,1),(7,-1),CG),
+        ('FONTNAME',(1,1),(1,-1),'Helvetica-Bold'),
+        ('FONTNAME',(3,1),(3,-1),'Helvetica-Bold'),
+        ('FONTNAME',(5,1),(5,-1),'Helvetica-Bold'),
+        ('FONTNAME',(7,1),(7,-1),'Helvetica-Bold'),
         ('ALIGN',(0,0),(-1,-1),'CENTER'),
         ('ALIGN',(0,1),(0,-1),'LEFT'),
         ('ALIGN',(4,1),(4,-1),'LEFT'),
         ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
         ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
+        ('LEFTPADDING',(0,0),(-1,-1),4),('RIGHTPADDING',(0,0),(-1,-1),4),
         ('ROWBACKGROUNDS',(0,1),(-1,-1),[white,CLt]),
         ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
         ('BOX',(0,0),(-1,-1),0.5,CBd),
-    ]))
+    ] + gap_styles))
     story.append(gt)
     story.append(Spacer(1, 4*mm))
 
@@ -497,12 +814,39 @@ def _gap_page(res_name, scores, gaps, benchmarks, rank, total):
 # ══════════════════════════════════════════════════════════════════════════════════
 # PAGE 5 – MOMENTUM & REVIEW INTELLIGENCE
 # ══════════════════════════════════════════════════════════════════════════════════
-def _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev):
+# Generator for the placeholder velocity series when no momentum data exists.
+_RNG = np.random.default_rng(42)
+
+# Rating split shown when the restaurant has no matched reviews (read-only).
+_DEFAULT_RC = pd.Series([40,30,15,10,5], index=[5,4,3,2,1])
+
+_TRENDS = (("ACCELERATING", '#22C55E'), ("DECLINING", '#EF4444'), ("STABLE", '#F59E0B'))
+
+_QUALITY_TABLE_STYLE = TableStyle(_header_cmds() + [
+    ('ALIGN',(0,0),(-1,-1),'CENTER'),
+    ('ALIGN',(0,1),(0,-1),'LEFT'),
+    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+    ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
+    ('ROWBACKGROUNDS',(0,1),(-1,-1),[white,CLt]),
+    ('FONTNAME',(0,1),(0,-1),'Helvetica-Bold'),
+    ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
+    ('BOX',(0,0),(-1,-1),0.5,CBd),
+])
+
+def _momentum_stats(counts):
+    """Average monthly velocity, last-3-month average and an index into _TRENDS."""
+    c = np.asarray(counts, dtype=np.float64)
+    avg = c.mean() if c.size else 0.0
+    r3  = c[-3:].mean() if c.size >= 3 else avg
+    trend = 0 if r3 > avg * 1.1 else (1 if r3 < avg * 0.8 else 2)
+    return float(avg), float(r3), trend
+
+def _momentum_page(res_name, rec, scores, momentum_data, df_rev, rev_rows=None):
     """
-    FIX: now receives df_rest so the donut chart can use _slug matching
-    instead of the broken exact URL string match.
+    FIX: the donut chart matches reviews on the restaurant's _slug instead of
+    the broken exact URL string match.  The slug comes from rec (the
+    restaurant's record, see _res_record), so df_rest is not scanned by name.
     """
-    import pandas as pd
     story = [Spacer(1, 5*mm)]
     story.append(Paragraph("04 / Momentum & Review Intelligence", STYLES['H1']))
     story.append(HRFlowable(width='100%', thickness=2, color=CG, spaceAfter=3*mm))
@@ -514,19 +858,21 @@ def _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev):
     story.append(Spacer(1, 3*mm))
 
     if momentum_data is not None and len(momentum_data) > 0:
-        months = [str(m)[:7] for m in momentum_data['month']]
-        counts = [float(c) for c in momentum_data['count']]
+        month_col = momentum_data['month']
+        if pd.api.types.is_datetime64_any_dtype(month_col):
+            months = month_col.dt.strftime('%Y-%m').tolist()
+        else:
+            months = month_col.astype(str).str.slice(0, 7).tolist()
+        counts = momentum_data['count'].to_numpy(dtype=np.float64)
     else:
         months = [f"{y}-{m:02d}" for y,m in
                   [(2025,m) for m in range(3,13)] + [(2026,m) for m in range(1,4)]]
-        counts = np.random.poisson(3.5, len(months)).tolist()
+        counts = _RNG.poisson(3.5, len(months)).astype(np.float64)
 
-    avg_vel   = sum(counts)/len(counts) if counts else 0
-    recent3   = sum(counts[-3:])/3 if len(counts) >= 3 else avg_vel
-    trend_str = "ACCELERATING" if recent3 > avg_vel * 1.1 else ("DECLINING" if recent3 < avg_vel * 0.8 else "STABLE")
-    trend_clr = '#22C55E' if trend_str == "ACCELERATING" else ('#EF4444' if trend_str == 'DECLINING' else '#F59E0B')
+    avg_vel, recent3, trend = _momentum_stats(counts)
+    trend_str, trend_clr = _TRENDS[trend]
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(7.2, 2.8), gridspec_kw={'width_ratios':[3,1.2]})
+    fig, ax1 = _get_cached_fig((5.2, 2.8))
 
     x = range(len(counts))
     ax1.fill_between(x, counts, alpha=0.12, color='#0EA5E9')
@@ -538,34 +884,56 @@ def _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev):
     step = max(1, len(months)//6)
     ax1.set_xticks(list(range(0, len(months), step)))
     ax1.set_xticklabels([months[i][-5:] for i in range(0, len(months), step)], fontsize=7.5)
-    ax1.set_ylabel('Reviews/Month', fontsize=8); ax1.set_title('Review Velocity (13-Month)', fontsize=9, pad=4)
+    ax1.set_ylabel('Reviews/Month', fontsize=8)
     ax1.axhline(avg_vel, color='#64748B', linewidth=1, linestyle='--', alpha=0.7)
-    ax1.text(len(counts)-1, avg_vel+0.2, f"Avg:{avg_vel:.1f}", fontsize=7, color='#64748B', ha='right')
+    fig.subplots_adjust(left=0.11, right=0.98, top=0.91, bottom=0.12)
+    pos = ax1.get_position()
+    vel_labels = [
+        ((pos.x0 + pos.x1)/2, pos.y1 + 0.025, 'Review Velocity (13-Month)', 'Helvetica', 8.5, CN, 'centre'),
+        (*_fig_frac(ax1, len(counts)-1, avg_vel + 0.2), f"Avg:{avg_vel:.1f}", 'Helvetica', 6.5, CSl, 'right'),
+    ]
 
     # FIX: use _slug matching for the donut chart
     rc = None
-    if '_slug' in df_rest.columns and '_slug' in df_rev.columns:
-        try:
-            rest_slug = df_rest[df_rest['name'] == res_name].iloc[0]['_slug']
-            sub = df_rev[df_rev['_slug'] == rest_slug]
-            if len(sub) > 0 and 'review_rating' in df_rev.columns:
-                rc = sub['review_rating'].value_counts().sort_index(ascending=False)
-        except (IndexError, KeyError):
-            pass
-    if rc is None or len(rc) == 0:
-        rc = pd.Series([40,30,15,10,5], index=[5,4,3,2,1])
-
-    donut_clrs = ['#22C55E','#86EFAC','#FCD34D','#FCA5A5','#EF4444']
-    ax2.pie(rc.values, colors=donut_clrs[:len(rc)], startangle=90, wedgeprops={'width':0.5})
-    ax2.set_title('Rating Split', fontsize=9, pad=4)
-    legend_labels = [f"{i}★ ({v})" for i,v in zip(rc.index, rc.values)]
-    ax2.legend(legend_labels, loc='lower center', bbox_to_anchor=(0.5,-0.22), fontsize=6.5,
-               ncol=2, framealpha=0.8)
-
-    plt.tight_layout()
-    img_buf = io.BytesIO(); fig.savefig(img_buf, format='PNG', dpi=140, bbox_inches='tight'); plt.close(fig)
-    img_buf.seek(0)
-    story.append(RLImage(img_buf, width=168*mm, height=65*mm))
+    rest_slug = rec['_slug']
+    if rest_slug is not None and 'review_rating' in df_rev.columns:
+        ratings = df_rev['review_rating'].to_numpy()
+        if rev_rows is not None:
+            ratings = ratings[rev_rows.get(rest_slug, [])]
+        elif '_slug' in df_rev.columns:
+            ratings = ratings[df_rev['_slug'].eq(rest_slug).to_numpy()]
+        else:
+            ratings = ()
+        if len(ratings) > 0:
+            # Fixed 5..1 domain, binned like the dashboard donut: half-star and
+            # decimal ratings round to whole stars, so there are always 5 slices.
+            stars = np.asarray(ratings, dtype=float).round().clip(1, 5).astype(np.int8)
+            rc = pd.Series(np.bincount(stars, minlength=6)[5:0:-1], index=[5, 4, 3, 2, 1])
+    if rc is None:
+        rc = _DEFAULT_RC
+
+    donut = Drawing(48*mm, 65*mm)
+    pie = Pie()
+    pie.width = pie.height = 32*mm
+    pie.x, pie.y = 8*mm, 24*mm
+    pie.data = [int(v) for v in rc.values]
+    pie.startAngle, pie.direction = 90, 'anticlockwise'
+    pie.innerRadiusFraction = 0.5
+    pie.slices.strokeColor = white
+    pie.slices.strokeWidth = 0.5
+    for i, clr in enumerate(_DONUT_CLRS):
+        pie.slices[i].fillColor = clr
+    donut.add(pie)
+    donut.add(String(24*mm, 61*mm, 'Rating Split', fontName='Helvetica', fontSize=9,
+                     fillColor=CN, textAnchor='middle'))
+    donut.add(_legend(4*mm, 20*mm, [(clr, f"{r}* ({v})") for clr, r, v in
+                                    zip(_DONUT_CLRS, rc.index, rc.values)], columns=2, font_size=6.5))
+
+    charts = Table([[ChartImage(_chart_image(fig, 120*mm, 65*mm), vel_labels), donut]], colWidths=[120*mm, 48*mm])
+    charts.setStyle(TableStyle([('VALIGN',(0,0),(-1,-1),'TOP'), ('LEFTPADDING',(0,0),(-1,-1),0),
+                                ('RIGHTPADDING',(0,0),(-1,-1),0), ('TOPPADDING',(0,0),(-1,-1),0),
+                                ('BOTTOMPADDING',(0,0),(-1,-1),0)]))
+    story.append(charts)
     story.append(Spacer(1, 3*mm))
 
     tc_clr = HexColor(trend_clr)
@@ -596,36 +964,19 @@ def _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev):
     story.append(Spacer(1, 4*mm))
 
     story.append(Paragraph("Review Quality Matrix", STYLES['H2']))
-    rating    = float(res_data.get('rating_n',0) or 0)
-    rev_count = int(res_data.get('rev_count_n',0) or 0)
-    res_rate  = float(res_data.get('res_rate',0) or 0)
+    rating, rev_count, res_rate = rec['rating_n'], rec['rev_count_n'], rec['res_rate']
 
-    qdata = [["Metric","Current Value","Market Average","Top Performers","Assessment"]]
-    metrics = [
+    qdata = [
+        ("Metric","Current Value","Market Average","Top Performers","Assessment"),
         ("Google Rating",     f"{rating:.1f} *",    "4.3 *",    "4.7+ *",  "Strong" if rating>=4.5 else "Average"),
         ("Total Reviews",     f"{rev_count:,}",      "850",      "2,500+",  "High"   if rev_count>2000 else "Growing"),
         ("Response Rate",     f"{res_rate*100:.0f}%","45%",      "90%+",    "Critical" if res_rate<0.4 else "Good"),
         ("Review Velocity",   f"{avg_vel:.1f}/mo",   "2.8/mo",   "6+/mo",   "Active" if avg_vel>=3 else "Needs Boost"),
         ("Sentiment Score",   f"{scores['Intelligence']:.0f}/100","70","85+","Strong" if scores['Intelligence']>=80 else "Opportunity"),
     ]
-    for m in metrics:
-        qdata.append(list(m))
 
     qt = Table(qdata, colWidths=[38*mm,28*mm,28*mm,28*mm,33*mm], repeatRows=1)
-    qt.setStyle(TableStyle([
-        ('BACKGROUND',(0,0),(-1,0),CN),
-        ('TEXTCOLOR',(0,0),(-1,0),white),
-        ('FONTNAME',(0,0),(-1,0),'Helvetica-Bold'),
-        ('FONTSIZE',(0,0),(-1,0),8.5),
-        ('ALIGN',(0,0),(-1,-1),'CENTER'),
-        ('ALIGN',(0,1),(0,-1),'LEFT'),
-        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-        ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
-        ('ROWBACKGROUNDS',(0,1),(-1,-1),[white,CLt]),
-        ('FONTNAME',(0,1),(0,-1),'Helvetica-Bold'),
-        ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
-        ('BOX',(0,0),(-1,-1),0.5,CBd),
-    ]))
+    qt.setStyle(_QUALITY_TABLE_STYLE)
     story.append(qt)
     return story
 
@@ -633,133 +984,190 @@ def _momentum_page(res_name, res_data, scores, momentum_data, df_rest, df_rev):
 # ══════════════════════════════════════════════════════════════════════════════════
 # PAGE 6 – ACTION PLAN
 # ══════════════════════════════════════════════════════════════════════════════════
-def _action_page(res_name, scores, gaps, persona):
-    story = [Spacer(1, 5*mm)]
-    story.append(Paragraph("05 / Action Plan & Investment Roadmap", STYLES['H1']))
-    story.append(HRFlowable(width='100%', thickness=2, color=CPu, spaceAfter=3*mm))
-    story.append(Paragraph(
-        f"The following 90-day plan translates audit findings into a structured engagement for {res_name}. "
-        "Each initiative maps to a Praxiotech service, investment level, and projected business outcome.",
-        STYLES['Body']))
-    story.append(Spacer(1, 2*mm))
+# ── Action page tables ────────────────────────────────────────────────────────────
+# The roadmap and investment tables are fixed copy, so their styles (including
+# the per-phase colouring) are built once here and shared by every report.
+_ROADMAP = [
+    ["Phase","Timeframe","Initiative","Praxiotech Service","Investment","KPI"],
+    ["QUICK WIN","Days 1-14","Google Profile Optimization","Profile Audit + Setup","60 EUR/mo","Profile 100%"],
+    ["QUICK WIN","Days 1-14","AI Review Responses Live","AI Review Manager","120 EUR/mo","Rate > 80%"],
+    ["GROWTH","Days 15-45","Review Velocity Campaign","SMS Follow-up System","80 EUR/mo","+15 reviews"],
+    ["GROWTH","Days 15-45","Sentiment Monitoring","Sentiment Dashboard","80 EUR/mo","Alert <2hr"],
+    ["AUTHORITY","Days 46-90","Monthly Intelligence Brief","Reporting Suite","Incl.","Top 3 rank"],
+    ["AUTHORITY","Days 46-90","ROI Attribution Report","Revenue Dashboard","Incl.","3x bookings"],
+]
+_PHASE_BG = {'QUICK WIN': HexColor('#DCFCE7'), 'GROWTH': HexColor('#DBEAFE'), 'AUTHORITY': HexColor('#EDE9FE')}
+_PHASE_TC = {'QUICK WIN': CG, 'GROWTH': CB, 'AUTHORITY': CPu}
+
+_ROADMAP_TABLE_STYLE = TableStyle(_header_cmds(8) + [
+    ('FONTSIZE',(0,1),(-1,-1),8.5),
+    ('FONTSIZE',(0,1),(0,-1),8),
+    ('TEXTCOLOR',(0,1),(-1,-1),CN),
+    ('ALIGN',(0,0),(-1,-1),'CENTER'),
+    ('ALIGN',(2,1),(3,-1),'LEFT'),
+    ('LEFTPADDING',(0,1),(0,-1),4),('RIGHTPADDING',(0,1),(0,-1),4),
+    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+    ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
+    ('ROWBACKGROUNDS',(0,1),(-1,-1),[white,CLt]),
+    ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
+    ('BOX',(0,0),(-1,-1),0.5,CBd),
+] + [
+    cmd for ri, row in enumerate(_ROADMAP[1:], start=1)
+    for cmd in (('BACKGROUND',(0,ri),(0,ri), _PHASE_BG.get(row[0],white)),
+                ('TEXTCOLOR',(0,ri),(0,ri),  _PHASE_TC.get(row[0],CN)),
+                ('FONTNAME',(0,ri),(0,ri),   'Helvetica-Bold'))
+])
+
+_INVESTMENT = [
+    ["Service Tier","Monthly","Annual","Expected Impact"],
+    ["Starter  (AI Reviews + Profile)","180 EUR","2,160 EUR","+8-15% booking conversion"],
+    ["Growth   (+ Velocity + Sentiment)","340 EUR","4,080 EUR","+20-30% digital authority"],
+    ["Authority (Full Suite)","480 EUR","5,760 EUR","+35-50% organic traffic"],
+    ["RECOMMENDED FOR THIS RESTAURANT","340 EUR","4,080 EUR","Est. ROI: 4.2x in 12 months"],
+]
+
+_INVESTMENT_TABLE_STYLE = TableStyle(_header_cmds() + [
+    ('FONTSIZE',(0,1),(-1,-1),9),
+    ('FONTSIZE',(0,-1),(-1,-1),8.5),
+    ('TEXTCOLOR',(0,1),(-1,-2),CN),
+    ('BACKGROUND',(0,-1),(-1,-1),HexColor('#0F172A')),
+    ('TEXTCOLOR',(0,-1),(-1,-1),CT),
+    ('FONTNAME',(0,-1),(-1,-1),'Helvetica-Bold'),
+    ('ALIGN',(0,0),(-1,-1),'CENTER'),('ALIGN',(0,1),(0,-1),'LEFT'),
+    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+    ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
+    ('ROWBACKGROUNDS',(0,1),(-1,-2),[white,CLt]),
+    ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
+    ('BOX',(0,0),(-1,-1),0.5,CBd),
+])
+
+# Sales pitch boxes: (label markup, persona key, label style, body style, box style).
+_PITCHES = tuple(
+    (f"<b>{label}</b>", key,
+     S(f'pl{lang}',fontName='Helvetica-Bold',fontSize=9,textColor=color),
+     S(f'pb{lang}',fontSize=9.5,textColor=CN,leading=14,alignment=TA_JUSTIFY),
+     TableStyle([
+         ('BACKGROUND',(0,0),(-1,0),bg),
+         ('BACKGROUND',(0,1),(-1,1),white),
+         ('LINEABOVE',(0,0),(-1,0),3,color),
+         ('BOX',(0,0),(-1,-1),0.5,CBd),
+         ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
+         ('LEFTPADDING',(0,0),(-1,-1),9),('RIGHTPADDING',(0,0),(-1,-1),9),
+     ]))
+    for lang, label, key, color, bg in (
+        ('EN', 'ENGLISH Opening Hook',     'pitch_en', CB, HexColor('#EFF6FF')),
+        ('DE', 'DEUTSCH Verkaufsargument', 'pitch_de', CT, HexColor('#F0FDFA')),
+    )
+)
 
-    dims   = ['Reputation','Responsiveness','Digital\nPresence','Intelligence','Visibility']
-    sc_v   = [scores['Reputation'], scores['Responsiveness'], scores['Digital Presence'],
-               scores['Intelligence'], scores['Visibility']]
-    bm_v   = [88, 90, 85, 75, 70]
-    angles = np.linspace(0, 2*np.pi, len(dims), endpoint=False).tolist()
-    sc_v  += sc_v[:1]; bm_v += bm_v[:1]; angles += angles[:1]
-
-    fig, ax = plt.subplots(figsize=(2.8, 2.8), subplot_kw=dict(polar=True))
-    ax.plot(angles, sc_v,  'o-', linewidth=2, color='#0EA5E9', label='Score')
-    ax.fill(angles, sc_v, alpha=0.12, color='#0EA5E9')
-    ax.plot(angles, bm_v, '--', linewidth=1.2, color='#A855F7', label='Benchmark')
-    ax.fill(angles, bm_v, alpha=0.05, color='#A855F7')
-    ax.set_thetagrids(np.degrees(angles[:-1]), dims, fontsize=7.5)
-    ax.set_ylim(0,100); ax.set_yticks([25,50,75,100]); ax.set_yticklabels(['25','50','75','100'], fontsize=6)
-    ax.yaxis.grid(color='#E2E8F0'); ax.xaxis.grid(color='#E2E8F0')
-    fig.patch.set_facecolor('#FFFFFF'); ax.set_facecolor('#F8FAFC')
-    ax.legend(loc='upper right', bbox_to_anchor=(1.35, 1.1), fontsize=7)
-    plt.tight_layout()
-    radar_buf = io.BytesIO(); fig.savefig(radar_buf, format='PNG', dpi=140, bbox_inches='tight'); plt.close(fig)
-    radar_buf.seek(0)
-
-    rdmap = [
-        ["Phase","Timeframe","Initiative","Praxiotech Service","Investment","KPI"],
-        ["QUICK WIN","Days 1-14","Google Profile Optimization","Profile Audit + Setup","60 EUR/mo","Profile 100%"],
-        ["QUICK WIN","Days 1-14","AI Review Responses Live","AI Review Manager","120 EUR/mo","Rate > 80%"],
-        ["GROWTH","Days 15-45","Review Velocity Campaign","SMS Follow-up System","80 EUR/mo","+15 reviews"],
-        ["GROWTH","Days 15-45","Sentiment Monitoring","Sentiment Dashboard","80 EUR/mo","Alert <2hr"],
-        ["AUTHORITY","Days 46-90","Monthly Intelligence Brief","Reporting Suite","Incl.","Top 3 rank"],
-        ["AUTHORITY","Days 46-90","ROI Attribution Report","Revenue Dashboard","Incl.","3x bookings"],
-    ]
-    phase_bg = {'QUICK WIN': HexColor('#DCFCE7'), 'GROWTH': HexColor('#DBEAFE'), 'AUTHORITY': HexColor('#EDE9FE')}
-    phase_tc = {'QUICK WIN': CG, 'GROWTH': CB, 'AUTHORITY': CPu}
-
-    rh = [Paragraph(t, STYLES['TH']) for t in rdmap[0]]
-    rrows = [rh]
-    for row in rdmap[1:]:
-        rrows.append([Paragraph(str(c), S('rt',fontSize=8.5,textColor=CN,
-                       alignment=TA_CENTER if i != 2 and i != 3 else TA_LEFT)) for i,c in enumerate(row)])
-
-    rt = Table(rrows, colWidths=[20*mm,20*mm,42*mm,40*mm,20*mm,25*mm], repeatRows=1)
-    pstyles = []
-    for ri, row in enumerate(rdmap[1:], start=1):
-        ph = row[0]
-        pstyles += [('BACKGROUND',(0,ri),(0,ri), phase_bg.get(ph,white)),
-                    ('TEXTCOLOR',(0,ri),(0,ri),   phase_tc.get(ph,CN)),
-                    ('FONTNAME',(0,ri),(0,ri),    'Helvetica-Bold')]
-    rt.setStyle(TableStyle([
-        ('BACKGROUND',(0,0),(-1,0),CN),
-        ('FONTSIZE',(0,0),(-1,0),8),
-        ('ALIGN',(0,0),(-1,-1),'CENTER'),
-        ('ALIGN',(2,1),(3,-1),'LEFT'),
-        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-        ('TOPPADDING',(0,0),(-1,-1),5),('BOTTOMPADDING',(0,0),(-1,-1),5),
-        ('ROWBACKGROUNDS',(0,1),(-1,-1),[white,CLt]),
-        ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
-        ('BOX',(0,0),(-1,-1),0.5,CBd),
-    ] + pstyles))
 
-    tbl = Table([[RLImage(radar_buf, width=58*mm, height=58*mm), rt]],
+# Radar geometry, in points within the 58 mm square cell: centre, outer radius
+# (score 100) and the axis labels (matplotlib's polar layout, 0° = east, CCW).
+_RADAR_SIZE = 58*mm
+_RADAR_C    = (_RADAR_SIZE*0.47, _RADAR_SIZE*0.42)
+_RADAR_R    = _RADAR_SIZE*0.31
+_RADAR_BM   = (88, 90, 85, 75, 70)
+_RADAR_LBL  = (('Reputation',), ('Responsiveness',), ('Digital', 'Presence'),
+               ('Intelligence',), ('Visibility',))
+_RADAR_ANG  = tuple(2*math.pi*i/len(_DIMS) for i in range(len(_DIMS)))
+CRadar, CRadarBm = HexColor('#0EA5E9'), HexColor('#A855F7')
+
+def _radar_points(values):
+    cx, cy = _RADAR_C
+    pts = []
+    for a, v in zip(_RADAR_ANG, values):
+        r = _RADAR_R*min(max(v, 0), 100)/100
+        pts += [cx + r*math.cos(a), cy + r*math.sin(a)]
+    return pts
+
+def _radar_drawing(sc_v):
+    """Score vs benchmark radar for the five dimensions (sc_v in _DIMS order),
+    drawn as vector shapes."""
+    d = Drawing(_RADAR_SIZE, _RADAR_SIZE)
+    cx, cy = _RADAR_C
+    d.add(Circle(cx, cy, _RADAR_R, fillColor=HexColor('#F8FAFC'), strokeColor=CN, strokeWidth=0.8))
+    for v in (25, 50, 75):
+        d.add(Circle(cx, cy, _RADAR_R*v/100, fillColor=None, strokeColor=CBd, strokeWidth=0.5))
+    for a in _RADAR_ANG:
+        d.add(Line(cx, cy, cx + _RADAR_R*math.cos(a), cy + _RADAR_R*math.sin(a),
+                   strokeColor=CBd, strokeWidth=0.5))
+    ta = math.radians(22.5)   # radial tick labels sit between the first two spokes
+    for v in (25, 50, 75, 100):
+        r = _RADAR_R*v/100
+        d.add(String(cx + r*math.cos(ta) + 1, cy + r*math.sin(ta) + 1, str(v),
+                     fontName='Helvetica', fontSize=5, fillColor=CN))
+
+    d.add(Polygon(_radar_points(_RADAR_BM), fillColor=CRadarBm, fillOpacity=0.05,
+                  strokeColor=CRadarBm, strokeWidth=0.8, strokeDashArray=[2.5, 1.5]))
+    pts = _radar_points(sc_v)
+    d.add(Polygon(pts, fillColor=CRadar, fillOpacity=0.12, strokeColor=CRadar, strokeWidth=1.4))
+    for i in range(0, len(pts), 2):
+        d.add(Circle(pts[i], pts[i+1], 1.8, fillColor=CRadar, strokeColor=None))
+
+    for a, lines in zip(_RADAR_ANG, _RADAR_LBL):
+        ca, sa = math.cos(a), math.sin(a)
+        anchor = 'start' if ca > 0.3 else 'end' if ca < -0.3 else 'middle'
+        x = cx + (_RADAR_R + 4)*ca
+        y = cy + (_RADAR_R + 5)*sa + (len(lines) - 1)*3.5 - (5 if sa < -0.3 else 1.5)
+        for j, text in enumerate(lines):
+            d.add(String(x, y - j*7, text, fontName='Helvetica', fontSize=6,
+                         fillColor=CN, textAnchor=anchor))
+
+    lx, ly = _RADAR_SIZE - 44, _RADAR_SIZE - 6
+    for j, (label, clr, dash) in enumerate((('Score', CRadar, None), ('Benchmark', CRadarBm, [2.5, 1.5]))):
+        y = ly - j*8
+        d.add(Line(lx, y + 2, lx + 10, y + 2, strokeColor=clr, strokeWidth=1.2, strokeDashArray=dash))
+        d.add(String(lx + 13, y, label, fontName='Helvetica', fontSize=6, fillColor=CN))
+    return d
+
+
+def _action_page(res_name, scores, gaps, persona):
+    rt = Table(_ROADMAP,
+               colWidths=[20*mm,20*mm,42*mm,40*mm,20*mm,25*mm], repeatRows=1)
+    rt.setStyle(_ROADMAP_TABLE_STYLE)
+
+    tbl = Table([[_radar_drawing([float(scores[d]) for d in _DIMS]), rt]],
                 colWidths=[62*mm, 113*mm])
     tbl.setStyle(TableStyle([('VALIGN',(0,0),(-1,-1),'TOP'),('LEFTPADDING',(1,0),(1,0),5)]))
-    story.append(tbl)
-    story.append(Spacer(1, 4*mm))
 
-    story.append(Paragraph("Investment Summary", STYLES['H2']))
-    inv = [
-        ["Service Tier","Monthly","Annual","Expected Impact"],
-        ["Starter  (AI Reviews + Profile)","180 EUR","2,160 EUR","+8-15% booking conversion"],
-        ["Growth   (+ Velocity + Sentiment)","340 EUR","4,080 EUR","+20-30% digital authority"],
-        ["Authority (Full Suite)","480 EUR","5,760 EUR","+35-50% organic traffic"],
-        ["RECOMMENDED FOR THIS RESTAURANT","340 EUR","4,080 EUR","Est. ROI: 4.2x in 12 months"],
+    it = Table(_INVESTMENT,
+               colWidths=[66*mm,26*mm,26*mm,57*mm], repeatRows=1)
+    it.setStyle(_INVESTMENT_TABLE_STYLE)
+
+    story = [
+        Spacer(1, 5*mm),
+        Paragraph("05 / Action Plan & Investment Roadmap", STYLES['H1']),
+        HRFlowable(width='100%', thickness=2, color=CPu, spaceAfter=3*mm),
+        Paragraph(
+            f"The following 90-day plan translates audit findings into a structured engagement for {res_name}. "
+            "Each initiative maps to a Praxiotech service, investment level, and projected business outcome.",
+            STYLES['Body']),
+        Spacer(1, 2*mm),
+        tbl,
+        Spacer(1, 4*mm),
+        Paragraph("Investment Summary", STYLES['H2']),
+        it,
+        Spacer(1, 4*mm),
+        Paragraph("Sales Pitch Scripts", STYLES['H2']),
     ]
-    it = Table([[Paragraph(c, STYLES['TH']) for c in inv[0]]] +
-               [[Paragraph(str(c), S('itc',fontSize=9,textColor=CN,alignment=TA_CENTER if i>0 else TA_LEFT))
-                 for i,c in enumerate(row)] for row in inv[1:]],
-               colWidths=[62*mm,28*mm,28*mm,57*mm], repeatRows=1)
-    it.setStyle(TableStyle([
-        ('BACKGROUND',(0,0),(-1,0),CN),
-        ('BACKGROUND',(0,-1),(-1,-1),HexColor('#0F172A')),
-        ('TEXTCOLOR',(0,-1),(-1,-1),CT),
-        ('FONTNAME',(0,-1),(-1,-1),'Helvetica-Bold'),
-        ('ALIGN',(0,0),(-1,-1),'CENTER'),('ALIGN',(0,1),(0,-1),'LEFT'),
-        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-        ('TOPPADDING',(0,0),(-1,-1),6),('BOTTOMPADDING',(0,0),(-1,-1),6),
-        ('ROWBACKGROUNDS',(0,1),(-1,-2),[white,CLt]),
-        ('LINEBELOW',(0,0),(-1,-1),0.4,CBd),
-        ('BOX',(0,0),(-1,-1),0.5,CBd),
-    ]))
-    story.append(it)
-    story.append(Spacer(1, 4*mm))
+    for pitch in _PITCHES:
+        story.extend(_pitch_block(pitch, persona))
+    story.extend([
+        HRFlowable(width='100%', thickness=0.5, color=CBd, spaceAfter=2*mm),
+        Paragraph(
+            f"Disclaimer: This brief is for internal Praxiotech sales use only. Benchmarks derived from public "
+            f"Google Maps data for Frankfurt City. Projected ROI figures are estimates based on comparable client results "
+            f"and are not guaranteed. Prepared {datetime.now().strftime('%B %Y')}.",
+            STYLES['Note']),
+    ])
+    return story
 
-    story.append(Paragraph("Sales Pitch Scripts", STYLES['H2']))
-    p = persona
 
-    for lang, label, color, body in [
-        ('EN', 'ENGLISH Opening Hook', CB,  p['pitch_en']),
-        ('DE', 'DEUTSCH Verkaufsargument', CT, p['pitch_de']),
-    ]:
-        pt = Table([
-            [Paragraph(f"<b>{label}</b>", S(f'pl{lang}',fontName='Helvetica-Bold',fontSize=9,textColor=color))],
-            [Paragraph(body, S(f'pb{lang}',fontSize=9.5,textColor=CN,leading=14,alignment=TA_JUSTIFY))],
-        ], colWidths=[175*mm])
-        pt.setStyle(TableStyle([
-            ('BACKGROUND',(0,0),(-1,0),HexColor('#EFF6FF') if lang=='EN' else HexColor('#F0FDFA')),
-            ('BACKGROUND',(0,1),(-1,1),white),
-            ('LINEABOVE',(0,0),(-1,0),3,color),
-            ('BOX',(0,0),(-1,-1),0.5,CBd),
-            ('TOPPADDING',(0,0),(-1,-1),7),('BOTTOMPADDING',(0,0),(-1,-1),7),
-            ('LEFTPADDING',(0,0),(-1,-1),9),('RIGHTPADDING',(0,0),(-1,-1),9),
-        ]))
-        story.append(pt)
-        story.append(Spacer(1, 3*mm))
-
-    story.append(HRFlowable(width='100%', thickness=0.5, color=CBd, spaceAfter=2*mm))
-    story.append(Paragraph(
-        f"Disclaimer: This brief is for internal Praxiotech sales use only. Benchmarks derived from public "
-        f"Google Maps data for Frankfurt City. Projected ROI figures are estimates based on comparable client results "
-        f"and are not guaranteed. Prepared {datetime.now().strftime('%B %Y')}.",
-        STYLES['Note']))
-    return story
\ No newline at end of file
+def _pitch_block(pitch, persona):
+    label, key, label_st, body_st, box_st = pitch
+    pt = Table([
+        [Paragraph(label, label_st)],
+        [Paragraph(persona[key], body_st)],
+    ], colWidths=[175*mm])
+    pt.setStyle(box_st)
+    return [pt, Spacer(1, 3*mm)]
@@ -35,41 +35,101 @@ Bug fix vs v1.2:
   compute_momentum() now accepts and uses df_rest (with _slug already computed)
   to ensure slug-based matching instead of falling back to synthetic data.
 """
+import threading
+import weakref
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from data_audit import find_col
+from data_audit import find_col, month_keys, _url_slugs
 
 
 def compute_dimension_scores(res_name: str, df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> dict:
-    try:
-        row = df_rest[df_rest["name"] == res_name].iloc[0]
-    except IndexError:
+    """Scores for one restaurant, looked up in the table compute_all_dimension_scores
+    builds once per df_rest instead of scanning the frame for every call."""
+    records = _per_frame(df_rest, "score_records",
+                         lambda: _score_table(df_rest, df_rev).to_dict("index"))
+    if res_name not in records:
         return {k: 0 for k in [
             "Reputation", "Responsiveness", "Digital Presence",
             "Intelligence", "Visibility", "Composite",
         ]}
+    return dict(records[res_name])
+
+
+# id(frame) -> (weakref to frame, {key: derived object}).  The weakref guards
+# against a new frame reusing the id of one that has been garbage-collected.
+_FRAME_CACHE: dict = {}
+_FRAME_LOCK = threading.Lock()
+
+
+def _per_frame(df: pd.DataFrame, key: str, build):
+    """Build (once per frame) and return an object derived from df.
+
+    Streamlit runs sessions on separate threads, so the cache is only touched
+    under _FRAME_LOCK; build() runs outside it (it may recurse into _per_frame).
+    """
+    with _FRAME_LOCK:
+        hit = _FRAME_CACHE.get(id(df))
+        if hit is None or hit[0]() is not df:
+            for k in [k for k, (ref, _) in _FRAME_CACHE.items() if ref() is None]:
+                del _FRAME_CACHE[k]
+            hit = _FRAME_CACHE[id(df)] = (weakref.ref(df), {})
+        if key in hit[1]:
+            return hit[1][key]
+    value = build()
+    with _FRAME_LOCK:
+        return hit[1].setdefault(key, value)
+
+
+def _score_table(df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> pd.DataFrame:
+    return _per_frame(df_rest, "scores", lambda: compute_all_dimension_scores(df_rest, df_rev))
+
+
+def _rest_records(df_rest: pd.DataFrame) -> dict:
+    """name -> plain dict of that restaurant's row, so per-restaurant helpers read
+    fields with dict lookups instead of pandas Series access.  Keeps the first
+    row per name, like the former df_rest[df_rest["name"] == name].iloc[0] scans."""
+    return _per_frame(df_rest, "records", lambda: (
+        df_rest.drop_duplicates("name").set_index("name", drop=False).to_dict("index")))
+
+
+def compute_all_dimension_scores(df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized compute_dimension_scores for every restaurant in one pass.
+
+    Returns a DataFrame indexed by name with the same six columns as the
+    per-restaurant dict.  Duplicate names keep their first row, matching the
+    `.iloc[0]` lookup used by the scalar version.
+    """
+    rest = df_rest[df_rest["name"].notna() & ~df_rest["name"].duplicated()]
+
+    def num(col, default):
+        return rest[col].astype(float) if col in rest.columns else pd.Series(default, index=rest.index)
+
+    rating    = num("rating_n", 0.0)
+    rev_count = num("rev_count_n", 0.0)
+    res_rate  = num("res_rate", 0.0)
+    sentiment = num("sentiment", 0.0)
+    recency   = num("recency_score", 0.5).replace(0.0, 0.5)   # same as `or 0.5` in the scalar path
+
+    website_col = find_col(rest, ["website"])
+    phone_col   = find_col(rest, ["phone"])
+    price_col   = find_col(rest, ["price"])
+
+    has_website = rest[website_col].notna() if website_col else pd.Series(False, index=rest.index)
+    has_phone   = rest[phone_col].notna()   if phone_col   else pd.Series(False, index=rest.index)
+    if price_col:
+        price_raw   = rest[price_col].fillna("").astype(str)
+        price_bonus = np.where(price_raw.str.contains("Mehr", regex=False), 10,
+                               np.where(price_raw.str.contains("20", regex=False), 5, 2))
+    else:
+        price_bonus = 2
 
-    rating    = float(row.get("rating_n", 0) or 0)
-    rev_count = float(row.get("rev_count_n", 0) or 0)
-    res_rate  = float(row.get("res_rate", 0) or 0)
-    sentiment = float(row.get("sentiment", 0) or 0)
-    recency   = float(row.get("recency_score", 0.5) or 0.5)
-
-    website_col = find_col(df_rest, ["website"])
-    phone_col   = find_col(df_rest, ["phone"])
-    price_col   = find_col(df_rest, ["price"])
-
-    has_website = bool(website_col and not pd.isna(row.get(website_col, None)))
-    has_phone   = bool(phone_col   and not pd.isna(row.get(phone_col, None)))
-    price_raw   = str(row.get(price_col, "") or "") if price_col else ""
-    price_bonus = 10 if "Mehr" in price_raw else 5 if "20" in price_raw else 2
-
-    score_rep = min((rating / 5.0) * 70 + min(rev_count / 500.0, 1.0) * 30, 100)
-    score_res = min(res_rate * 100, 100)
-    score_dig = min((50 if has_website else 10) + (25 if has_phone else 0) + 15 + price_bonus, 100)
-    score_int = min(sentiment, 100)
-    score_vis = min(recency * 100, 100)
+    score_rep = np.minimum((rating / 5.0) * 70 + np.minimum(rev_count / 500.0, 1.0) * 30, 100)
+    score_res = np.minimum(res_rate * 100, 100)
+    score_dig = np.minimum(np.where(has_website, 50, 10) + np.where(has_phone, 25, 0) + 15 + price_bonus, 100)
+    score_int = np.minimum(sentiment, 100)
+    score_vis = np.minimum(recency * 100, 100)
     composite = (
         score_rep * 0.30
         + score_res * 0.25
@@ -78,72 +138,110 @@ def compute_dimension_scores(res_name: str, df_rest: pd.DataFrame, df_rev: pd.Da
         + score_vis * 0.10
     )
 
-    return {
-        "Reputation":       round(score_rep, 1),
-        "Responsiveness":   round(score_res, 1),
-        "Digital Presence": round(score_dig, 1),
-        "Intelligence":     round(score_int, 1),
-        "Visibility":       round(score_vis, 1),
-        "Composite":        round(composite, 1),
-    }
+    # Python's round() per value, as the scalar formula used: numpy's .round(1)
+    # rounds the scaled float half-to-even and can move a composite by 0.1.
+    def round1(values):
+        return [round(v, 1) for v in np.asarray(values, dtype=float).tolist()]
+
+    return pd.DataFrame({
+        "Reputation":       round1(score_rep),
+        "Responsiveness":   round1(score_res),
+        "Digital Presence": np.asarray(score_dig, dtype=np.int64),   # whole points, an int as before
+        "Intelligence":     round1(score_int),
+        "Visibility":       round1(score_vis),
+        "Composite":        round1(composite),
+    }, index=pd.Index(rest["name"], name="name"))
+
+
+def rank_restaurants(scores: pd.DataFrame) -> pd.DataFrame:
+    """District ranking from a compute_all_dimension_scores table: name, score and
+    rank (1 = best) by Composite descending.  The sort is stable, so tied scores
+    keep table order and every caller ranks them the same way."""
+    df_ranks = (
+        scores["Composite"].rename("score")
+        .reset_index()
+        .sort_values("score", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+    df_ranks["rank"] = df_ranks.index + 1
+    return df_ranks
 
 
-def get_gap_analysis(scores: dict, benchmarks: dict) -> dict:
-    standard = {
-        "Reputation":       benchmarks.get("rating", 4.4) * 20,
-        "Responsiveness":   90.0,
-        "Digital Presence": 85.0,
-        "Intelligence":     75.0,
-        "Visibility":       70.0,
-    }
-    gaps = {d: round(standard[d] - scores[d], 1) for d in standard}
-    return dict(sorted(gaps.items(), key=lambda x: x[1], reverse=True))
+_DIM_ORDER = ("Reputation", "Responsiveness", "Digital Presence", "Intelligence", "Visibility")
+_BASELINE  = np.array([0.0, 90.0, 85.0, 75.0, 70.0])   # Reputation is filled in per call
 
 
-def compute_momentum(res_name: str, df_rev: pd.DataFrame, df_rest: pd.DataFrame = None) -> pd.DataFrame:
-    """Compute monthly review velocity.  df_rest must be passed so _slug matching works."""
+def get_gap_analysis(scores: dict, benchmarks: dict) -> dict:
+    standard    = _BASELINE.copy()
+    standard[0] = benchmarks.get("rating", 4.4) * 20
+    diffs = standard - np.fromiter((scores[d] for d in _DIM_ORDER), float, len(_DIM_ORDER))
+    gaps  = [round(g, 1) for g in diffs.tolist()]
+    # Largest gap first; the stable sort keeps dimension order for ties, as sorted() did.
+    order = np.argsort(-np.array(gaps), kind="stable")
+    return {_DIM_ORDER[i]: gaps[i] for i in order}
+
+
+def compute_momentum(res_name: str, df_rev: pd.DataFrame, df_rest: pd.DataFrame = None,
+                     rev_rows: dict = None) -> pd.DataFrame:
+    """Compute monthly review velocity.  df_rest must be passed so _slug matching works;
+    restaurants without a slug match get synthetic data.  rev_rows (slug ->
+    positional review rows, built once per dataset) is derived from df_rev and
+    cached per frame when not supplied."""
     try:
         url_col = find_col(df_rev, ["page_url", "url", "link"])
         if url_col is None or "normalized_date" not in df_rev.columns:
             return _synthetic_momentum()
 
-        subset = pd.DataFrame()
-
-        # Primary: slug-based match using pre-computed _slug in df_rest
+        target_slug = None
         if df_rest is not None and "_slug" in df_rest.columns:
             try:
-                rest_row    = df_rest[df_rest["name"] == res_name].iloc[0]
-                target_slug = rest_row["_slug"]
-                if "_slug" not in df_rev.columns:
-                    from data_audit import _url_slug
-                    df_rev["_slug"] = df_rev[url_col].apply(_url_slug)
-                subset = df_rev[df_rev["_slug"] == target_slug].copy()
-            except (IndexError, KeyError):
+                target_slug = _rest_records(df_rest)[res_name]["_slug"]
+            except KeyError:
                 pass
-
-        # Fallback: derive slug from restaurant name
-        if len(subset) == 0:
-            from data_audit import _url_slug
-            if "_slug" not in df_rev.columns:
-                df_rev["_slug"] = df_rev[url_col].apply(_url_slug)
-            name_slug = res_name.lower().replace(" ", "+")
-            subset = df_rev[
-                df_rev["_slug"].str.contains(name_slug[:20], na=False, regex=False)
-            ].copy()
-
-        if len(subset) == 0:
+        if not isinstance(target_slug, str):     # missing slug: None or a NaN float
             return _synthetic_momentum()
 
-        subset["_month"] = pd.to_datetime(subset["normalized_date"]).dt.to_period("M")
-        monthly = subset.groupby("_month").size().reset_index(name="count")
-        monthly["month"] = monthly["_month"].dt.to_timestamp()
-        return monthly[["month", "count"]].sort_values("month").tail(13).reset_index(drop=True)
+        if rev_rows is None:
+            rev_rows = _per_frame(df_rev, "rev_rows", lambda: _slug_rows(df_rev, url_col))
+        rows = rev_rows.get(target_slug, [])
+        if len(rows) == 0:
+            return _synthetic_momentum()
+        # Integer month keys (added at load) make the monthly count one bincount;
+        # only the last 13 months with reviews are turned back into timestamps.
+        if "_mkey" in df_rev.columns:
+            keys = df_rev["_mkey"].to_numpy()[rows]
+        else:
+            keys = month_keys(pd.to_datetime(df_rev["normalized_date"].iloc[rows])).to_numpy()
+        keys = keys[keys >= 0]
+        if len(keys) == 0:
+            return _synthetic_momentum()
+        base   = keys.min()
+        counts = np.bincount(keys - base)
+        slots  = np.flatnonzero(counts)[-13:]
+        months = pd.to_datetime(pd.DataFrame({
+            "year": (slots + base) // 12, "month": (slots + base) % 12 + 1, "day": 1,
+        })).astype(df_rev["normalized_date"].dtype)
+        return pd.DataFrame({"month": months, "count": counts[slots].astype("int64")})
 
     except Exception:
         return _synthetic_momentum()
 
 
+def _slug_rows(df_rev: pd.DataFrame, url_col: str) -> dict:
+    """Positional review rows per slug.  load_and_clean_data adds _slug to df_rev;
+    derive it locally for frames that lack it rather than mutating the caller's frame."""
+    slugs = df_rev["_slug"] if "_slug" in df_rev.columns else _url_slugs(df_rev[url_col])
+    return df_rev.groupby(slugs, sort=False, observed=True).indices
+
+
 def _synthetic_momentum() -> pd.DataFrame:
+    """Placeholder velocity for restaurants without matched reviews.  One draw is
+    shared per calendar month; callers get their own copy."""
+    return _synthetic_template(datetime.now().strftime("%Y-%m")).copy()
+
+
+@lru_cache(maxsize=1)
+def _synthetic_template(month: str) -> pd.DataFrame:
     dates  = list(pd.date_range(end=datetime.now(), periods=13, freq="MS"))
     counts = np.random.poisson(lam=3.5, size=13).tolist()
     return pd.DataFrame({"month": dates, "count": counts})
@@ -152,7 +250,7 @@ def _synthetic_momentum() -> pd.DataFrame:
 def get_silent_winner_flag(res_name: str, df_rest: pd.DataFrame) -> bool:
     """High rating but low responsiveness → big Praxiotech opportunity."""
     try:
-        row = df_rest[df_rest["name"] == res_name].iloc[0]
+        row = _rest_records(df_rest)[res_name]
         return (
             float(row.get("rating_n", 0) or 0) >= 4.5
             and float(row.get("res_rate", 1) or 1) < 0.30
@@ -161,9 +259,78 @@ def get_silent_winner_flag(res_name: str, df_rest: pd.DataFrame) -> bool:
         return False
 
 
+# Persona copy per rating/price bucket.  Pitches are str.format_map templates
+# filled with res_name, rating, rev_count and res_rate_pct.
+_PERSONAS = {
+    "upscale": {
+        "primary": "The Upscale Experience Seeker",
+        "segment": "Corporate Dinner / Special Occasion",
+        "motivation": (
+            "Seeks prestige, Instagram-worthy moments, and flawless service. "
+            "Books via OpenTable or direct website."
+        ),
+        "pitch_en": (
+            "{res_name} is already exceptional — rated {rating:.1f} stars with over "
+            "{rev_count:,} reviews. But with only {res_rate_pct:.0f}% of customer reviews "
+            "receiving a reply, you're leaving trust and revenue on the table. "
+            "High-spending diners read owner responses before booking. "
+            "Praxiotech's AI Review Manager ensures every guest feels heard, turning "
+            "4-star experiences into loyal 5-star advocates. "
+            "Investment: 120 EUR/mo. Expected return: 2-3x booking uplift in 90 days."
+        ),
+        "pitch_de": (
+            "{res_name} ist bereits ausgezeichnet — {rating:.1f} Sterne mit {rev_count:,} "
+            "Bewertungen. Doch nur {res_rate_pct:.0f}% der Gäste erhalten eine Antwort. "
+            "Mit Praxiotechs KI-Bewertungsmanagement verwandeln wir stille Gäste in treue "
+            "Stammkunden. Investition: 120 EUR/Monat. ROI innerhalb von 90 Tagen sichtbar."
+        ),
+    },
+    "dinner_date": {
+        "primary": "The Dinner Date Romantic",
+        "segment": "Business Date / Luncher",
+        "motivation": (
+            "Values speed and digital convenience. Most likely to book via mobile. "
+            "Reads reviews on Google before deciding."
+        ),
+        "pitch_en": (
+            "{res_name} commands a strong {rating:.1f}-star reputation across {rev_count:,} "
+            "reviews. However, with a {res_rate_pct:.0f}% response rate, the digital "
+            "conversation is one-sided. Top 3 competitors average 85%+ responsiveness. "
+            "Praxiotech closes this gap: AI responses, review campaigns, weekly reports — "
+            "120 EUR/month. This is the difference between being found and being chosen."
+        ),
+        "pitch_de": (
+            "{res_name} hat {rating:.1f} Sterne mit {rev_count:,} Rezensionen. "
+            "Nur {res_rate_pct:.0f}% Antwortrate vs. 85% der Top-Konkurrenz. "
+            "Praxiotech schliesst diese Lücke: KI-Antworten, Bewertungskampagnen, "
+            "wöchentliche Reports — 120 EUR/Monat."
+        ),
+    },
+    "explorer": {
+        "primary": "The Curious Explorer",
+        "segment": "Walk-in / Discovery Diner",
+        "motivation": (
+            "Discovers restaurants through Google Maps and social proof. "
+            "Heavily influenced by recent review activity."
+        ),
+        "pitch_en": (
+            "{res_name} has solid foundations with a {rating:.1f} rating and "
+            "{rev_count:,} reviews. Praxiotech targets three levers: fresh review "
+            "acquisition, responsiveness automation, and Google profile optimization. "
+            "Est. 15-25% increase in foot traffic within 60 days."
+        ),
+        "pitch_de": (
+            "{res_name} hat solide {rating:.1f} Sterne. Praxiotech: neue Bewertungen "
+            "gewinnen, Antworten automatisieren, Google-Profil optimieren. "
+            "+15-25% mehr Laufkundschaft in 60 Tagen."
+        ),
+    },
+}
+
+
 def get_customer_persona(res_name: str, df_rest: pd.DataFrame, df_rev: pd.DataFrame) -> dict:
     try:
-        row       = df_rest[df_rest["name"] == res_name].iloc[0]
+        row       = _rest_records(df_rest)[res_name]
         rating    = float(row.get("rating_n", 4.0) or 4.0)
         price_col = find_col(df_rest, ["price"])
         price     = str(row.get(price_col, "20-30") or "20-30") if price_col else "20-30"
@@ -173,70 +340,18 @@ def get_customer_persona(res_name: str, df_rest: pd.DataFrame, df_rev: pd.DataFr
         rating, price, rev_count, res_rate = 4.0, "20-30", 100, 0.0
 
     if "Mehr" in price or rating >= 4.7:
-        primary    = "The Upscale Experience Seeker"
-        segment    = "Corporate Dinner / Special Occasion"
-        motivation = (
-            "Seeks prestige, Instagram-worthy moments, and flawless service. "
-            "Books via OpenTable or direct website."
-        )
-        pitch_en = (
-            f"{res_name} is already exceptional — rated {rating:.1f} stars with over "
-            f"{rev_count:,} reviews. But with only {res_rate*100:.0f}% of customer reviews "
-            f"receiving a reply, you're leaving trust and revenue on the table. "
-            f"High-spending diners read owner responses before booking. "
-            f"Praxiotech's AI Review Manager ensures every guest feels heard, turning "
-            f"4-star experiences into loyal 5-star advocates. "
-            f"Investment: 120 EUR/mo. Expected return: 2-3x booking uplift in 90 days."
-        )
-        pitch_de = (
-            f"{res_name} ist bereits ausgezeichnet — {rating:.1f} Sterne mit {rev_count:,} "
-            f"Bewertungen. Doch nur {res_rate*100:.0f}% der Gäste erhalten eine Antwort. "
-            f"Mit Praxiotechs KI-Bewertungsmanagement verwandeln wir stille Gäste in treue "
-            f"Stammkunden. Investition: 120 EUR/Monat. ROI innerhalb von 90 Tagen sichtbar."
-        )
+        persona = _PERSONAS["upscale"]
     elif rating >= 4.4:
-        primary    = "The Dinner Date Romantic"
-        segment    = "Business Date / Luncher"
-        motivation = (
-            "Values speed and digital convenience. Most likely to book via mobile. "
-            "Reads reviews on Google before deciding."
-        )
-        pitch_en = (
-            f"{res_name} commands a strong {rating:.1f}-star reputation across {rev_count:,} "
-            f"reviews. However, with a {res_rate*100:.0f}% response rate, the digital "
-            f"conversation is one-sided. Top 3 competitors average 85%+ responsiveness. "
-            f"Praxiotech closes this gap: AI responses, review campaigns, weekly reports — "
-            f"120 EUR/month. This is the difference between being found and being chosen."
-        )
-        pitch_de = (
-            f"{res_name} hat {rating:.1f} Sterne mit {rev_count:,} Rezensionen. "
-            f"Nur {res_rate*100:.0f}% Antwortrate vs. 85% der Top-Konkurrenz. "
-            f"Praxiotech schliesst diese Lücke: KI-Antworten, Bewertungskampagnen, "
-            f"wöchentliche Reports — 120 EUR/Monat."
-        )
+        persona = _PERSONAS["dinner_date"]
     else:
-        primary    = "The Curious Explorer"
-        segment    = "Walk-in / Discovery Diner"
-        motivation = (
-            "Discovers restaurants through Google Maps and social proof. "
-            "Heavily influenced by recent review activity."
-        )
-        pitch_en = (
-            f"{res_name} has solid foundations with a {rating:.1f} rating and "
-            f"{rev_count:,} reviews. Praxiotech targets three levers: fresh review "
-            f"acquisition, responsiveness automation, and Google profile optimization. "
-            f"Est. 15-25% increase in foot traffic within 60 days."
-        )
-        pitch_de = (
-            f"{res_name} hat solide {rating:.1f} Sterne. Praxiotech: neue Bewertungen "
-            f"gewinnen, Antworten automatisieren, Google-Profil optimieren. "
-            f"+15-25% mehr Laufkundschaft in 60 Tagen."
-        )
+        persona = _PERSONAS["explorer"]
 
+    params = {"res_name": res_name, "rating": rating, "rev_count": rev_count,
+              "res_rate_pct": res_rate * 100}
     return {
-        "primary":    primary,
-        "segment":    segment,
-        "motivation": motivation,
-        "pitch_en":   pitch_en,
-        "pitch_de":   pitch_de,
-    }
\ No newline at end of file
+        "primary":    persona["primary"],
+        "segment":    persona["segment"],
+        "motivation": persona["motivation"],
+        "pitch_en":   persona["pitch_en"].format_map(params),
+        "pitch_de":   persona["pitch_de"].format_map(params),
+    }